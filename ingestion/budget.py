@@ -38,25 +38,12 @@ def check_budget(
         - DB 접근, 파일 쓰기, datetime.now()/date.today() 호출 금지
         - 날짜 변경 시 리셋은 상위 계층(DB 조회 로직) 책임
     """
-    # 남은 호출 수 계산
-    remaining_calls = daily_limit - used_calls_today
-
-    # remaining_calls < 0 이면 0으로 간주
-    if remaining_calls < 0:
-        remaining_calls = 0
-
-    # 예산 초과 판단
-    if remaining_calls >= required_calls:
-        # 예산 충분: 수집 허용
-        return {
-            "should_collect": True,
-            "remaining_calls": remaining_calls,
-            "reason": "budget_ok",
-        }
-    else:
-        # 예산 부족: 수집 차단
-        return {
-            "should_collect": False,
-            "remaining_calls": remaining_calls,
-            "reason": "budget_exceeded",
-        }
+    # 남은 호출 수 계산 (음수는 0으로 간주, 분기 없이 max로 처리)
+    remaining_calls = max(0, daily_limit - used_calls_today)
+    should_collect = remaining_calls >= required_calls
+
+    return {
+        "should_collect": should_collect,
+        "remaining_calls": remaining_calls,
+        "reason": "budget_ok" if should_collect else "budget_exceeded",
+    }
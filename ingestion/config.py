@@ -0,0 +1,47 @@
+"""환경 변수 기반 설정.
+
+MYSQL_* 값은 DBConfig.from_env()에서 한 번만 읽고 파싱하여 불변 객체로 보관한다.
+(load_dotenv 이후에 호출해야 .env 값이 반영됨)
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class DBConfig:
+    """MySQL 접속 정보 (환경 변수에서 한 번에 읽어 불변으로 보관)."""
+
+    host: str = "localhost"
+    port: int = 3306
+    user: str = "root"
+    password: str = ""
+    database: str = "mcp_subway"
+
+    @classmethod
+    def from_env(cls) -> "DBConfig":
+        """
+        MYSQL_HOST/PORT/USER/PASSWORD/DATABASE 환경 변수로 생성.
+
+        Raises:
+            ValueError: MYSQL_PORT가 정수가 아닌 경우
+        """
+        env = os.environ
+        return cls(
+            host=env.get("MYSQL_HOST", cls.host),
+            port=int(env.get("MYSQL_PORT", cls.port)),
+            user=env.get("MYSQL_USER", cls.user),
+            password=env.get("MYSQL_PASSWORD", cls.password),
+            database=env.get("MYSQL_DATABASE", cls.database),
+        )
+
+    def as_connect_kwargs(self) -> dict[str, Any]:
+        """DB-API connect()에 그대로 넘길 접속 인자 (pymysql/MySQLdb 공통)."""
+        return {
+            "host": self.host,
+            "port": self.port,
+            "user": self.user,
+            "password": self.password,
+            "database": self.database,
+        }
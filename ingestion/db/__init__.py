@@ -0,0 +1,2 @@
+"""Database connection modules."""
+
@@ -0,0 +1,41 @@
+"""MySQL 연결 생성 helper (CLI 스크립트 전용).
+
+cron tick마다 새 프로세스가 뜨므로 프로세스 내 커넥션 풀은 두지 않는다.
+Runner/Pipeline은 기존대로 mysql_conn만 주입받는다.
+"""
+
+from typing import Any
+
+try:
+    # libmysqlclient C 확장 (파라미터 바인딩/결과 파싱이 C에서 수행됨)
+    import MySQLdb as mysql_driver
+except ImportError:  # pragma: no cover - 빌드 환경에 따라 다름
+    # 순수 Python 드라이버 (동일 DB-API, 동일 connect 인자)
+    import pymysql as mysql_driver
+
+from ingestion.config import DBConfig
+
+
+def connect(config: DBConfig) -> Any:
+    """
+    DBConfig 기준 MySQL 연결 생성.
+
+    mysqlclient(MySQLdb)가 설치되어 있으면 우선 사용하고, 없으면 pymysql 사용.
+    두 드라이버 모두 %s paramstyle이므로 Pipeline SQL은 그대로 동작한다.
+
+    binary_prefix=True: bytes 파라미터(payload_hash raw digest)를 _binary'...'로
+    전송하여 utf8mb4 문자열로 해석되지 않도록 한다 (Invalid utf8mb4 경고 방지).
+
+    cursorclass는 지정하지 않는다: 두 드라이버의 기본 tuple Cursor를 유지하여
+    모든 조회가 row[0] 인덱스로 읽히고 row마다 dict를 만들지 않도록 한다.
+
+    autocommit=True: Budget/검증 SELECT가 암묵적 트랜잭션(read view)을 열지 않도록 하고,
+    쓰기 경로(Runner, ingest_provider_result)만 begin() ~ commit()으로 묶는다.
+    """
+    return mysql_driver.connect(
+        **config.as_connect_kwargs(),
+        charset="utf8mb4",
+        binary_prefix=True,
+        autocommit=True,
+    )
+
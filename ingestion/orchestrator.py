@@ -6,6 +6,7 @@ from typing import Any
 from ingestion.budget import check_budget
 from ingestion.runner.snapshot_runner import run_snapshot_once
 from ingestion.scheduler import decide_collection
+from ingestion.tz import SEOUL_TZ
 
 
 def get_last_snapshot_at(mysql_conn: Any) -> datetime | None:
@@ -22,13 +23,17 @@ def get_last_snapshot_at(mysql_conn: Any) -> datetime | None:
     주의:
         - snapshot 단위 기준으로 조회 (call_log 기준 아님)
         - snapshot_id 또는 created_at 기준으로 가장 최신 스냅샷 시각 계산
+        - idx_created_at 인덱스의 마지막 leaf만 읽도록 ORDER BY ... LIMIT 1 사용
+          (매 tick 호출되므로 raw 테이블 전체 스캔 금지)
     """
     cursor = mysql_conn.cursor()
     try:
-        # snapshot_id 기준으로 가장 최근 snapshot의 created_at 조회
+        # 가장 최근 snapshot의 created_at 조회 (idx_created_at 사용)
         sql = """
-        SELECT MAX(created_at) AS last_snapshot_at
+        SELECT created_at
         FROM subway_arrival_raw
+        ORDER BY created_at DESC
+        LIMIT 1
         """
         cursor.execute(sql)
         result = cursor.fetchone()
@@ -47,6 +52,7 @@ def run_orchestrator_once(
     mysql_conn,
     clock,
     used_calls_today: int,
+    snapshot_id: str | None = None,
 ) -> dict:
     """
     Orchestrator 단발 실행: 시간대 정책 + 예산 가드 + Snapshot Runner 결합.
@@ -58,6 +64,7 @@ def run_orchestrator_once(
         mysql_conn: MySQL 연결 객체 (외부 주입)
         clock: 현재 시각을 반환하는 callable (DI)
         used_calls_today: 오늘 사용한 호출 수 (외부 주입, DB/로그/메트릭에서 계산)
+        snapshot_id: 호출자가 미리 만든 snapshot_id (선택, None이면 now로 생성)
 
     Returns:
         {
@@ -97,15 +104,14 @@ def run_orchestrator_once(
 
     # 2) 실행 간격 체크 (마지막 snapshot 실행 시각 기준)
     last_snapshot_at = get_last_snapshot_at(mysql_conn)
+    # 경과 시간은 여기서 한 번만 계산하여 이후 모든 반환값에 재사용
+    elapsed_seconds: float | None = None
 
     if last_snapshot_at is not None:
         # last_snapshot_at이 timezone-aware가 아닐 수 있으므로 변환
         if last_snapshot_at.tzinfo is None:
             # MySQL DATETIME은 timezone-naive이므로 Asia/Seoul로 가정
-            import pytz
-
-            seoul_tz = pytz.timezone("Asia/Seoul")
-            last_snapshot_at = seoul_tz.localize(last_snapshot_at)
+            last_snapshot_at = last_snapshot_at.replace(tzinfo=SEOUL_TZ)
 
         # now와 last_snapshot_at을 같은 timezone으로 맞춤
         if now.tzinfo != last_snapshot_at.tzinfo:
@@ -140,15 +146,12 @@ def run_orchestrator_once(
             "snapshot_id": None,
             "last_snapshot_at": last_snapshot_at,
             "interval_seconds": interval_seconds,
-            "elapsed_seconds": (
-                (now - last_snapshot_at).total_seconds()
-                if last_snapshot_at is not None
-                else None
-            ),
+            "elapsed_seconds": elapsed_seconds,
         }
 
-    # 4) snapshot_id 생성 (실행기 책임)
-    snapshot_id = now.strftime("%Y%m%d_%H%M%S")
+    # 4) snapshot_id 생성 (실행기 책임, 호출자가 넘긴 값이 있으면 재사용)
+    if snapshot_id is None:
+        snapshot_id = now.strftime("%Y%m%d_%H%M%S")
 
     # 5) Snapshot Runner 호출
     snapshot_result = run_snapshot_once(
@@ -160,12 +163,6 @@ def run_orchestrator_once(
     )
 
     # 6) 실행 완료 반환
-    elapsed_seconds = (
-        (now - last_snapshot_at).total_seconds()
-        if last_snapshot_at is not None
-        else None
-    )
-
     return {
         "executed": True,
         "reason": "executed",
@@ -8,6 +8,22 @@ Budget 계산은 STEP 8.5에서 본 테이블을 단일 진실 소스로 전환
 from datetime import datetime
 from typing import Any
 
+from ingestion.util.sql import values_clause
+
+# 모듈 로드 시 한 번만 생성하는 SQL 문자열 (호출마다 재조립하지 않음)
+# 서버 측 PREPARE는 pymysql/mysqlclient가 지원하지 않으므로 사용하지 않는다
+_CALL_LOG_SQL_PREFIX = """
+    INSERT INTO subway_api_call_log
+    (call_date, snapshot_id, page_start, page_end, called_at, status)
+    VALUES """
+_CALL_LOG_ROW_PLACEHOLDER = "(%s, %s, %s, %s, %s, %s)"
+_CALL_LOG_SQL_SUFFIX = """
+    ON DUPLICATE KEY UPDATE
+    status = VALUES(status),
+    called_at = VALUES(called_at)
+    """
+_INSERT_CALL_LOG_SQL = _CALL_LOG_SQL_PREFIX + _CALL_LOG_ROW_PLACEHOLDER + _CALL_LOG_SQL_SUFFIX
+
 
 def insert_call_log(
     *,
@@ -39,18 +55,51 @@ def insert_call_log(
 
     cursor = mysql_conn.cursor()
     try:
-        sql = """
-        INSERT INTO subway_api_call_log
-        (call_date, snapshot_id, page_start, page_end, called_at, status)
-        VALUES (%s, %s, %s, %s, %s, %s)
-        ON DUPLICATE KEY UPDATE
-        status = VALUES(status),
-        called_at = VALUES(called_at)
-        """
         cursor.execute(
-            sql,
+            _INSERT_CALL_LOG_SQL,
             (call_date, snapshot_id, page_start, page_end, called_at, status),
         )
         # commit/rollback은 호출자가 제어
     finally:
         cursor.close()
+
+
+def insert_call_logs(
+    *,
+    mysql_conn: Any,
+    entries: list[tuple[str, int, int, datetime, str]],
+) -> None:
+    """
+    여러 API 호출 기록을 multi-row VALUES INSERT 1회로 삽입.
+
+    Args:
+        mysql_conn: MySQL 연결 객체 (외부 주입)
+        entries: (snapshot_id, page_start, page_end, called_at, status) 튜플 리스트
+
+    주의:
+        - commit/rollback은 호출자(Runner)가 제어
+        - insert_call_log와 동일한 UNIQUE / ON DUPLICATE KEY UPDATE 규칙
+        - entries가 비어 있으면 DB에 접근하지 않음
+        - 드라이버의 executemany 재작성 여부에 의존하지 않고 VALUES를 직접 확장
+    """
+    if not entries:
+        return
+
+    # call_date는 called_at의 날짜 부분 (Asia/Seoul 기준)
+    params = [
+        value
+        for snapshot_id, page_start, page_end, called_at, status in entries
+        for value in (called_at.date(), snapshot_id, page_start, page_end, called_at, status)
+    ]
+    sql = (
+        _CALL_LOG_SQL_PREFIX
+        + values_clause(_CALL_LOG_ROW_PLACEHOLDER, len(entries))
+        + _CALL_LOG_SQL_SUFFIX
+    )
+
+    cursor = mysql_conn.cursor()
+    try:
+        cursor.execute(sql, params)
+        # commit/rollback은 호출자가 제어
+    finally:
+        cursor.close()
@@ -1,10 +1,90 @@
 """서울 지하철 실시간 도착정보 OpenAPI Provider Adapter."""
 
+import sys
 import xml.etree.ElementTree as ET
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # libxml2 기반 파서 (ElementTree와 동일한 XMLPullParser API)
+    from lxml import etree as _lxml_etree
+except ImportError:  # pragma: no cover - 설치 환경에 따라 다름
+    _lxml_etree = None
+
+
+# 루트 직계 자식 중 parse_xml이 읽는 태그
+_TOP_LEVEL_TAGS = ("RESULT", "totalCount", "row")
+
+
+def _new_pull_parser() -> Any:
+    """
+    row 스트리밍용 XMLPullParser 생성 (lxml 우선, 없으면 ElementTree).
+
+    lxml은 주석/PI를 트리에 남기므로 row 평탄화에 섞이지 않도록 제거한다.
+    lxml은 C 레벨 tag 필터로 _TOP_LEVEL_TAGS의 end 이벤트만 만들고,
+    ElementTree는 필터가 없으므로 start/end 이벤트로 depth를 추적한다.
+    """
+    if _lxml_etree is not None:
+        return _lxml_etree.XMLPullParser(
+            events=("end",),
+            tag=_TOP_LEVEL_TAGS,
+            remove_comments=True,
+            remove_pis=True,
+        )
+    return ET.XMLPullParser(events=("start", "end"))
+
+
+# parse_xml이 한 번에 feed하는 문자 수 (chunk마다 이벤트를 비워 row를 바로 해제)
+_FEED_CHUNK_CHARS = 64 * 1024
+
+
+def _iter_top_level(parser: Any, xml_text: str) -> Any:
+    """
+    xml_text를 chunk 단위로 feed하며 루트 직계 자식 요소를 문서 순서대로 반환.
+
+    chunk마다 read_events()를 비우므로 호출자가 yield된 row를 clear()하면
+    다음 chunk를 파싱하기 전에 해제된다 (문서 전체 트리를 한 번에 만들지 않음).
+
+    lxml: tag 필터된 end 이벤트 중 부모가 루트인 요소 (row 내부의 totalCount 등 제외)
+    ElementTree: 모든 요소의 start/end 이벤트로 depth == 1인 요소
+    """
+    is_lxml = _lxml_etree is not None
+    depth = 0
+    n_chars = len(xml_text)
+    # 마지막 단계(offset == n_chars)에서 close()로 남은 이벤트를 flush
+    for offset in (*range(0, n_chars, _FEED_CHUNK_CHARS), n_chars):
+        if offset < n_chars:
+            parser.feed(xml_text[offset : offset + _FEED_CHUNK_CHARS])
+        else:
+            parser.close()
+
+        for event, elem in parser.read_events():
+            if is_lxml:
+                parent = elem.getparent()
+                if parent is not None and parent.getparent() is None:
+                    yield elem
+                continue
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1:
+                yield elem
+
+
+# lxml.etree.XMLSyntaxError는 lxml.etree.ParseError의 하위 클래스
+_PARSE_ERRORS: tuple[type[Exception], ...] = (ET.ParseError,)
+if _lxml_etree is not None:
+    _PARSE_ERRORS += (_lxml_etree.ParseError,)
+
+# row key intern (row 단위 hot path이므로 속성 조회를 모듈 로드 시 한 번만 수행)
+_intern = sys.intern
 
 
 @dataclass
@@ -24,31 +104,61 @@ class ProviderResult:
 
     pages: list[PageResult]
     all_rows: list[dict[str, str]]  # 3회 호출 결과를 단순 합친 것
-    first_row_keys: set[str] | None
+    first_row_keys: frozenset[str] | None  # 첫 row의 key 집합 (1회 계산, 불변)
 
 
-def parse_xml(xml_text: str) -> tuple[str, str, int | None, list[dict[str, str]]]:
+def parse_xml(
+    xml_text: str, parse_rows: bool = True
+) -> tuple[str, str, int | None, list[dict[str, str]]]:
     """
     XML 응답을 파싱하여 (result_code, result_message, total_count, rows) 반환.
 
     Args:
         xml_text: XML 응답 문자열
+        parse_rows: False이면 row dict 변환을 생략 (totalCount만 필요한 경우)
 
     Returns:
         (result_code, result_message, total_count, rows) 튜플
-        rows는 각 row를 dict[str, str]로 변환한 리스트
+        rows는 각 row를 dict[str, str]로 변환한 리스트 (parse_rows=False면 빈 리스트)
         total_count는 None일 수 있음
 
     Raises:
         RuntimeError: XML 파싱 실패 또는 필수 필드 누락 시
+
+    NOTE:
+        row는 __slots__ 객체가 아니라 dict로 반환한다. key 집합이 응답마다 고정되지 않고
+        (중첩/중복 태그는 "a_b", "a__1" 형태 key로 추가됨), orjson이 그대로 직렬화해야
+        raw_payload/payload_hash를 만들 수 있기 때문이다. row는 페이지 적재 후 바로 해제되므로
+        dict 헤더 비용(25 필드 기준 약 0.8KB/row)은 페이지당 1MB 미만이다.
     """
+    result_elem: Any = None  # ET.Element 또는 lxml Element
+    root_total_text: str | None = None
+    first_row_total_text: str | None = None
+    rows = []
+    seen_row = False
+
+    # chunk 단위 feed + 이벤트 소비: 처리한 row를 바로 clear()하여
+    # 문서 전체 트리를 메모리에 동시에 유지하지 않음
+    # 루트의 직계 자식(RESULT/totalCount/row)만 처리
+    parser = _new_pull_parser()
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError as e:
+        for elem in _iter_top_level(parser, xml_text):
+            if elem.tag == "row":
+                if not seen_row:
+                    first_row_total_text = elem.findtext("totalCount")
+                    seen_row = True
+                if parse_rows:
+                    rows.append(_row_to_dict(elem))
+                # 파싱이 끝난 row의 하위 요소 해제
+                elem.clear()
+            elif elem.tag == "RESULT" and result_elem is None:
+                result_elem = elem
+            elif elem.tag == "totalCount" and root_total_text is None:
+                root_total_text = elem.text or ""
+    except _PARSE_ERRORS as e:
         raise RuntimeError(f"XML 파싱 실패: {e}") from e
 
     # RESULT 정보 추출
-    result_elem = root.find("RESULT")
     if result_elem is None:
         raise RuntimeError("XML에 RESULT 요소가 없습니다")
 
@@ -63,63 +173,82 @@ def parse_xml(xml_text: str) -> tuple[str, str, int | None, list[dict[str, str]]
 
     # totalCount 추출: RESULT 내부의 total 또는 루트의 totalCount 또는 row 내부의 totalCount
     total_count: int | None = None
-    total_text = result_elem.findtext("total") or root.findtext("totalCount")
+    total_text = result_elem.findtext("total") or root_total_text
     if total_text:
         try:
             total_count = int(total_text.strip())
         except (ValueError, AttributeError):
             pass  # total_count는 None으로 유지
     # row 내부의 totalCount도 확인 (fallback)
-    if total_count is None:
-        first_row = root.find("row")
-        if first_row is not None:
-            row_total_text = first_row.findtext("totalCount")
-            if row_total_text:
-                try:
-                    total_count = int(row_total_text.strip())
-                except (ValueError, AttributeError):
-                    pass
-
-    # rows 추출
-    rows = []
-    row_elems = root.findall("row")
-
-    for row_elem in row_elems:
-        row_dict: dict[str, str] = {}
-        _parse_row_element(row_elem, row_dict, "")
-        rows.append(row_dict)
+    if total_count is None and first_row_total_text:
+        try:
+            total_count = int(first_row_total_text.strip())
+        except (ValueError, AttributeError):
+            pass
 
     return result_code, result_message, total_count, rows
 
 
+def _row_to_dict(elem: Any) -> dict[str, str]:
+    """
+    <row> 요소를 dict로 변환 (평탄한 row는 빠른 경로, 그 외는 _parse_row_element).
+
+    자식이 모두 텍스트 leaf이고 태그 중복이 없으면 결과는 _parse_row_element와 동일하다.
+    중첩/중복 태그를 만나면 처음부터 _parse_row_element로 다시 변환한다.
+    """
+    row_dict: dict[str, str] = {}
+    for child in elem:
+        key = child.tag
+        if len(child) or key in row_dict:
+            row_dict = {}
+            _parse_row_element(elem, row_dict, "")
+            return row_dict
+        text = child.text
+        row_dict[_intern(key)] = text.strip() if text else ""
+    return row_dict
+
+
 def _parse_row_element(elem: ET.Element, row_dict: dict[str, str], prefix: str = "") -> None:
     """
-    XML 요소를 재귀적으로 파싱하여 dict에 추가.
+    XML 요소를 깊이 우선으로 순회하여 dict에 추가.
 
     중복 태그 처리를 위해 prefix를 사용하여 충돌 회피.
     무손실 파싱을 위해 모든 태그를 key로 변환하고 값은 문자열로 저장.
     무손실의 범위는 XML 태그와 그 text로 한정 (tail은 제외).
+
+    재귀 대신 명시적 스택(자식 iterator)을 사용하며, 문서 순서는 재귀 방식과 동일하다.
+    key는 sys.intern으로 공유하여 페이지의 모든 row dict가 같은 key 문자열을 참조한다
+    (lxml은 .tag 접근마다 새 str을 만들므로 row 수 × 필드 수만큼의 중복 문자열 방지).
     """
-    for child in elem:
-        key = prefix + child.tag if prefix else child.tag
+    # 충돌 key별 마지막 사용 번호 (다음 번호를 O(1)로 결정)
+    counters: defaultdict[str, int] = defaultdict(int)
+    stack = [(iter(elem), prefix)]
 
-        # 자식 요소가 있으면 재귀적으로 파싱
+    while stack:
+        children, current_prefix = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            continue
+
+        key = _intern(current_prefix + child.tag)
+
+        # 자식 요소가 있으면 하위 요소를 먼저 순회 (중첩 구조)
         if len(child) > 0:
-            # 중첩된 구조인 경우 재귀적으로 파싱
-            _parse_row_element(child, row_dict, f"{key}_")
-        else:
-            # 자식이 없는 경우 (텍스트만 있거나 빈 요소)
-            text = child.text.strip() if child.text else ""
-            # 같은 key가 이미 존재하면 충돌 회피
-            if key in row_dict:
-                # 이미 존재하는 경우, 번호를 붙여서 저장
-                counter = 1
-                new_key = f"{key}__{counter}"
-                while new_key in row_dict:
-                    counter += 1
-                    new_key = f"{key}__{counter}"
-                key = new_key
-            row_dict[key] = text
+            stack.append((iter(child), f"{key}_"))
+            continue
+
+        # 자식이 없는 경우 (텍스트만 있거나 빈 요소)
+        text = child.text.strip() if child.text else ""
+        # 같은 key가 이미 존재하면 번호를 붙여서 충돌 회피
+        if key in row_dict:
+            base_key = key
+            counters[base_key] += 1
+            key = f"{base_key}__{counters[base_key]}"
+            while key in row_dict:
+                counters[base_key] += 1
+                key = f"{base_key}__{counters[base_key]}"
+        row_dict[key] = text
 
 
 class SeoulSubwayArrivalProvider:
@@ -128,6 +257,9 @@ class SeoulSubwayArrivalProvider:
     # 기본 호출 범위 (STEP 1용)
     DEFAULT_CALL_RANGES = [(0, 999), (1000, 1999), (2000, 2999)]
 
+    # HTTP 커넥션 풀 크기 (스냅샷당 최대 4페이지 동시 호출 기준)
+    POOL_MAXSIZE = 4
+
     def __init__(
         self,
         api_key: str,
@@ -155,6 +287,30 @@ class SeoulSubwayArrivalProvider:
         # 역명은 빈 문자열로 설정하여 전체 수집 (undocumented behavior)
         # NOTE: Runner/Repo/CLI에서 station_name을 알면 안 됨. Provider 내부 private로만 유지
         self._station_name = ""
+        # 페이지마다 바뀌지 않는 URL 앞/뒤 부분은 한 번만 조립
+        # 역명이 빈 문자열이면 URL 끝에 슬래시만 남음
+        self._url_prefix = f"{self.base_url}/{self.api_key}/xml/{self.service}/"
+        self._url_suffix = self._station_name
+
+        # keep-alive 커넥션 재사용을 위한 세션 (페이지마다 TCP 핸드셰이크 생략)
+        # 게이트웨이 일시 오류(502/503/504)만 짧게 재시도
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=["GET"],
+            ),
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def close(self) -> None:
+        """HTTP 세션 종료 (커넥션 풀 반환)."""
+        self._session.close()
 
     def _build_url(self, start: int, end: int) -> str:
         """
@@ -167,19 +323,18 @@ class SeoulSubwayArrivalProvider:
         Returns:
             완성된 API URL
         """
-        # 역명이 빈 문자열이면 URL 끝에 슬래시만 추가
-        if self._station_name:
-            return f"{self.base_url}/{self.api_key}/xml/{self.service}/{start}/{end}/{self._station_name}"
-        else:
-            return f"{self.base_url}/{self.api_key}/xml/{self.service}/{start}/{end}/"
+        return f"{self._url_prefix}{start}/{end}/{self._url_suffix}"
 
-    def fetch_page(self, start: int, end: int) -> dict[str, Any]:
+    def fetch_page(
+        self, start: int, end: int, parse_rows: bool = True
+    ) -> dict[str, Any]:
         """
         단일 페이지를 호출하여 데이터를 가져옴.
 
         Args:
             start: 시작 인덱스 (inclusive)
             end: 종료 인덱스 (inclusive)
+            parse_rows: False이면 rows 변환 생략 (total_count만 필요한 경우)
 
         Returns:
             {
@@ -195,7 +350,7 @@ class SeoulSubwayArrivalProvider:
         url = self._build_url(start, end)
 
         try:
-            response = requests.get(url, timeout=(5, 15))
+            response = self._session.get(url, timeout=(5, 15))
         except requests.RequestException as e:
             raise RuntimeError(f"HTTP 요청 실패: {e}") from e
 
@@ -204,7 +359,9 @@ class SeoulSubwayArrivalProvider:
                 f"HTTP 상태 코드 오류: {response.status_code}, URL: {url}"
             )
 
-        result_code, result_message, total_count, rows = parse_xml(response.text)
+        result_code, result_message, total_count, rows = parse_xml(
+            response.text, parse_rows=parse_rows
+        )
 
         # API 결과 코드 검증
         if result_code != "INFO-000":
@@ -227,13 +384,17 @@ class SeoulSubwayArrivalProvider:
             ranges: 호출할 범위 리스트
 
         Returns:
-            각 페이지의 fetch_page 결과 리스트
+            각 페이지의 fetch_page 결과 리스트 (ranges 순서 유지)
+
+        NOTE:
+        페이지 호출은 서로 독립적인 I/O이므로 스레드 풀로 동시에 수행한다.
+        하나라도 실패하면 해당 RuntimeError가 그대로 전파된다.
         """
-        results = []
-        for start, end in ranges:
-            result = self.fetch_page(start, end)
-            results.append(result)
-        return results
+        if not ranges:
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            return list(executor.map(lambda r: self.fetch_page(*r), ranges))
 
     def fetch_fixed_pages(
         self, call_ranges: list[tuple[int, int]] | None = None
@@ -257,8 +418,10 @@ class SeoulSubwayArrivalProvider:
         if call_ranges is None:
             call_ranges = self.DEFAULT_CALL_RANGES
 
-        for start, end in call_ranges:
-            page_data = self.fetch_page(start, end)
+        # 페이지 동시 호출 (결과는 call_ranges 순서 유지)
+        page_datas = self.fetch_pages(call_ranges)
+
+        for (start, end), page_data in zip(call_ranges, page_datas):
             total_count = page_data["total_count"]
             rows = page_data["rows"]
 
@@ -278,9 +441,9 @@ class SeoulSubwayArrivalProvider:
         )
 
         # first_row_keys 추출
-        first_row_keys: set[str] | None = None
+        first_row_keys: frozenset[str] | None = None
         if all_rows:
-            first_row_keys = set(all_rows[0].keys())
+            first_row_keys = frozenset(all_rows[0].keys())
 
         return ProviderResult(
             pages=pages,
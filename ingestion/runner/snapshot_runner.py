@@ -7,14 +7,103 @@ Budget 계산은 STEP 8.5에서 Call Log 테이블을 단일 진실 소스로 
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Callable
 
-from ingestion.pipeline.call_log import insert_call_log
+from ingestion.pipeline.call_log import insert_call_logs
 from ingestion.pipeline.raw_ingest import ingest_rows_page
 
 logger = logging.getLogger(__name__)
 
+# page 1 이후 호출 범위 (totalCount 기반 정책 판단 결과별)
+_RANGES_3 = (
+    (1000, 1999),  # page 2
+    (2000, 2999),  # page 3
+)
+_RANGES_4 = _RANGES_3 + (
+    (3000, 3999),  # page 4
+)
+
+
+@dataclass(slots=True)
+class PageIngestResult:
+    """페이지 단위 호출/적재 결과 (반환 시 dict로 변환)."""
+
+    start: int
+    end: int
+    status: str = "ok"  # "ok" | "error"
+    attempted_rows: int = 0
+    inserted_rows: int = 0
+    skipped_duplicates: int = 0
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """반환 계약(pages: list[dict]) 형태로 변환."""
+        return {
+            "start": self.start,
+            "end": self.end,
+            "status": self.status,
+            "attempted_rows": self.attempted_rows,
+            "inserted_rows": self.inserted_rows,
+            "skipped_duplicates": self.skipped_duplicates,
+            "error": self.error,
+        }
+
+
+def _execute_savepoint_sql(mysql_conn: Any, sql: str) -> None:
+    """SAVEPOINT 관련 SQL 실행 (페이지 단위 부분 롤백용)."""
+    cursor = mysql_conn.cursor()
+    try:
+        cursor.execute(sql)
+    finally:
+        cursor.close()
+
+
+def _rollback_to_page_savepoint(mysql_conn: Any, start: int) -> str | None:
+    """
+    적재 실패 페이지의 INSERT만 SAVEPOINT까지 롤백.
+
+    Returns:
+        성공 시 None, ROLLBACK TO SAVEPOINT 자체가 실패하면 snapshot 트랜잭션
+        전체를 rollback한 뒤 그 원인 메시지
+
+    주의:
+        - 전체 rollback 이후에는 열린 트랜잭션이 없어(autocommit 연결) 다음 INSERT가
+          즉시 반영되므로, 호출자는 남은 페이지를 적재하지 않아야 한다
+    """
+    try:
+        _execute_savepoint_sql(mysql_conn, f"ROLLBACK TO SAVEPOINT page_{start}")
+    except Exception as e:
+        mysql_conn.rollback()
+        return f"SAVEPOINT 롤백 실패로 snapshot 전체 rollback: {e}"
+    return None
+
+
+def _fetch_page_timed(
+    provider: Any,
+    clock: Callable[[], datetime],
+    start: int,
+    end: int,
+) -> tuple[dict[str, Any] | None, datetime, Exception | None]:
+    """
+    worker 스레드에서 페이지를 호출하고 호출이 끝난 시각을 함께 반환.
+
+    Returns:
+        (page_data, called_at, error) 튜플
+        호출 실패 시 page_data는 None, error에 예외를 담는다 (예외를 던지지 않음)
+
+    주의:
+        - 적재는 ranges 순서대로 진행되므로 결과를 꺼내는 시점에 clock()을 부르면
+          앞 페이지 적재 시간이 섞인다. called_at은 반드시 worker에서 기록한다.
+    """
+    try:
+        page_data = provider.fetch_page(start, end)
+    except Exception as e:
+        return None, clock(), e
+    return page_data, clock(), None
+
 
 def run_snapshot_once(
     *,
@@ -31,7 +120,9 @@ def run_snapshot_once(
         snapshot_id: 스냅샷 ID (외부에서 주입)
         call_ranges: 호출할 범위 리스트 (외부에서 주입, None이면 동적 결정)
         provider: SeoulSubwayArrivalProvider 인스턴스 (외부에서 주입)
-        mysql_conn: MySQL 연결 객체 (외부에서 주입, connect/close 금지)
+        mysql_conn: MySQL 연결 객체 (외부에서 주입, connect/close 금지,
+            begin()으로 snapshot 트랜잭션을 시작하므로 미완료 트랜잭션 없이 전달,
+            Call Log는 트랜잭션 종료 후 autocommit으로 기록하므로 autocommit 연결)
         clock: 현재 시각을 반환하는 callable (DI)
 
     Returns:
@@ -56,39 +147,51 @@ def run_snapshot_once(
           - totalCount 판단 없음
           - decided_page_count = None
     """
+    # 명시적 트랜잭션 시작: 페이지의 INSERT들이 statement마다 commit(fsync)되지 않고
+    # 아래의 명시적 commit 시점에 한 번에 반영되도록 보장
+    # (연결은 autocommit 모드 유지 → commit/rollback 이후의 조회는 트랜잭션 밖에서 실행)
+    mysql_conn.begin()
+
+    # [트랜잭션 규약] snapshot 전체를 하나의 트랜잭션으로 묶고 마지막에 1회 commit
+    # 페이지 적재 직전에 SAVEPOINT를 두어, 실패한 페이지의 INSERT만 되돌린다
+    # Call Log는 이 트랜잭션에 넣지 않는다 (commit 실패 시에도 호출 기록이 남아야 함)
+
+    # SAVEPOINT 롤백 실패로 snapshot 트랜잭션을 통째로 되돌린 경우의 원인
+    aborted_error: str | None = None
+
     # snapshot 기준 collected_at 결정 (모든 페이지에 동일하게 사용)
     snapshot_collected_at = clock()
     snapshot_time = snapshot_collected_at.isoformat()
 
     # 페이지별 결과 저장
-    pages_result = []
+    pages_result: list[PageIngestResult] = []
+
+    # Call Log 버퍼: 페이지마다 INSERT 하지 않고 snapshot 종료 시 한 번에 기록
+    # (snapshot_id, page_start, page_end, called_at, status)
+    call_log_entries: list[tuple[str, int, int, datetime, str]] = []
 
     # 동적 호출 횟수 결정
     if call_ranges is None:
         # [1단계] page 1 단독 호출 (offset 0~999)
         first_page_start = 0
         first_page_end = 999
-        page_1_success = False
         total_count = None
         decided_page_count = 3  # 기본값 (fallback)
 
+        fetched = False
         try:
             page_data = provider.fetch_page(first_page_start, first_page_end)
             total_count = page_data.get("total_count")
             rows = page_data["rows"]
 
-            # Call Log 기록
-            called_at = clock()
-            insert_call_log(
-                mysql_conn=mysql_conn,
-                snapshot_id=snapshot_id,
-                page_start=first_page_start,
-                page_end=first_page_end,
-                called_at=called_at,
-                status="success",
+            # Call Log 기록 (API 호출 성공)
+            call_log_entries.append(
+                (snapshot_id, first_page_start, first_page_end, clock(), "success")
             )
+            fetched = True
 
-            # 첫 페이지 데이터 적재
+            # 첫 페이지 데이터 적재 (실패 시 이 페이지 INSERT만 되돌리도록 SAVEPOINT)
+            _execute_savepoint_sql(mysql_conn, "SAVEPOINT page_0")
             ingest_result = ingest_rows_page(
                 mysql_conn=mysql_conn,
                 snapshot_id=snapshot_id,
@@ -97,70 +200,45 @@ def run_snapshot_once(
                 page_end=first_page_end,
                 rows=rows,
             )
-            mysql_conn.commit()
 
-            page_result = {
-                "start": first_page_start,
-                "end": first_page_end,
-                "status": "ok",
-                "attempted_rows": len(rows),
-                "inserted_rows": ingest_result["inserted_rows"],
-                "skipped_duplicates": ingest_result["skipped_duplicates"],
-                "error": None,
-            }
-            pages_result.append(page_result)
-            page_1_success = True
+            pages_result.append(
+                PageIngestResult(
+                    start=first_page_start,
+                    end=first_page_end,
+                    attempted_rows=len(rows),
+                    inserted_rows=ingest_result["inserted_rows"],
+                    skipped_duplicates=ingest_result["skipped_duplicates"],
+                )
+            )
 
             # [정책 결정] totalCount 기반 호출 횟수 결정 (단 한 번, 절대 변경 금지)
-            if total_count is not None and total_count > 3000:
-                decided_page_count = 4
-            else:
-                # totalCount가 없거나 ≤ 3000인 경우 3회 호출
-                decided_page_count = 3
+            # totalCount가 없거나 ≤ 3000인 경우 3회 호출
+            decided_page_count = 4 if (total_count or 0) > 3000 else 3
 
         except Exception as e:
-            # 첫 페이지 호출 실패 시 Call Log 기록
-            try:
-                called_at = clock()
-                insert_call_log(
-                    mysql_conn=mysql_conn,
-                    snapshot_id=snapshot_id,
-                    page_start=first_page_start,
-                    page_end=first_page_end,
-                    called_at=called_at,
-                    status="error",
+            # 첫 페이지 API 호출 실패 시 Call Log 기록 (error)
+            if not fetched:
+                call_log_entries.append(
+                    (snapshot_id, first_page_start, first_page_end, clock(), "error")
                 )
-            except Exception:
-                pass
-
-            mysql_conn.rollback()
+            else:
+                # 적재 실패 시 SAVEPOINT까지만 롤백 (snapshot 트랜잭션은 유지)
+                aborted_error = _rollback_to_page_savepoint(mysql_conn, first_page_start)
             # 첫 페이지 실패 시 기본 3회 호출로 fallback
             decided_page_count = 3
             total_count = None
 
-            page_result = {
-                "start": first_page_start,
-                "end": first_page_end,
-                "status": "error",
-                "attempted_rows": 0,
-                "inserted_rows": 0,
-                "skipped_duplicates": 0,
-                "error": str(e),
-            }
-            pages_result.append(page_result)
+            pages_result.append(
+                PageIngestResult(
+                    start=first_page_start,
+                    end=first_page_end,
+                    status="error",
+                    error=str(e),
+                )
+            )
 
         # [2단계] call_ranges 구성: page 1은 제외, 앞으로 호출할 페이지만 포함
-        if decided_page_count == 4:
-            call_ranges = [
-                (1000, 1999),   # page 2
-                (2000, 2999),   # page 3
-                (3000, 3999),   # page 4
-            ]
-        else:
-            call_ranges = [
-                (1000, 1999),   # page 2
-                (2000, 2999),   # page 3
-            ]
+        call_ranges = list(_RANGES_4 if decided_page_count == 4 else _RANGES_3)
 
         remaining_ranges = call_ranges
     else:
@@ -174,102 +252,128 @@ def run_snapshot_once(
         page_4_attempted = False
         page_4_success = False
 
-    # [3단계] 나머지 페이지 순차 실행 (페이지 단위 원자성)
-    # page_4_attempted와 page_4_success는 call_ranges=None인 경우 이미 초기화됨
-    # call_ranges가 제공된 경우에도 초기화되어 있음
-    for start, end in remaining_ranges:
-        # page 4 호출 시도 여부 추적
-        if start == 3000 and end == 3999:
-            page_4_attempted = True
-        page_result = {
-            "start": start,
-            "end": end,
-            "status": "ok",
-            "attempted_rows": 0,
-            "inserted_rows": 0,
-            "skipped_duplicates": 0,
-            "error": None,
-        }
-
-        try:
-            # Provider로 해당 페이지 호출
-            page_data = provider.fetch_page(start, end)
-            rows = page_data["rows"]
-            attempted_rows = len(rows)
-
-            # Call Log 기록 (API 호출 성공)
-            called_at = clock()  # 실제 API 호출 시각
-            insert_call_log(
-                mysql_conn=mysql_conn,
-                snapshot_id=snapshot_id,
-                page_start=start,
-                page_end=end,
-                called_at=called_at,
-                status="success",
-            )
-
-            # 해당 페이지의 rows만 Raw ingest 함수에 넘겨 DB 적재
-            ingest_result = ingest_rows_page(
-                mysql_conn=mysql_conn,
-                snapshot_id=snapshot_id,
-                collected_at=snapshot_collected_at,
-                page_start=start,
-                page_end=end,
-                rows=rows,
-            )
-
-            page_result["attempted_rows"] = attempted_rows
-            page_result["inserted_rows"] = ingest_result["inserted_rows"]
-            page_result["skipped_duplicates"] = ingest_result["skipped_duplicates"]
-            page_result["status"] = "ok"
-
-            # page 4 호출 성공 여부 추적
+    # [3단계] 나머지 페이지 동시 호출 (독립적인 HTTP I/O이므로 스레드로 병렬화)
+    # 호출 시각은 worker에서 기록하고, 호출 실패는 결과에 담겼다가 아래에서 재발생
+    with ThreadPoolExecutor(max_workers=max(len(remaining_ranges), 1)) as executor:
+        futures = [
+            executor.submit(_fetch_page_timed, provider, clock, start, end)
+            for start, end in remaining_ranges
+        ]
+
+        # [4단계] 페이지별 순차 적재 (페이지 단위 원자성)
+        # mysql_conn은 thread-safe하지 않으므로 적재/commit/rollback은 ranges 순서대로 수행
+        # executor 블록 안에서 적재하여 앞 페이지 INSERT 중에도 뒤 페이지 HTTP 호출이 진행됨
+        # page_4_attempted와 page_4_success는 call_ranges=None인 경우 이미 초기화됨
+        # call_ranges가 제공된 경우에도 초기화되어 있음
+        for (start, end), future in zip(remaining_ranges, futures):
+            # page 4 호출 시도 여부 추적
             if start == 3000 and end == 3999:
-                page_4_success = True
+                page_4_attempted = True
+            page_result = PageIngestResult(start=start, end=end)
 
-            # 페이지 성공 시 commit
-            mysql_conn.commit()
-
-        except Exception as e:
-            # API 호출 실패 시 Call Log 기록 (error)
+            fetched = False
             try:
-                called_at = clock()  # 실제 API 호출 시도 시각
-                insert_call_log(
+                # 해당 페이지 호출 결과 (호출 실패 시 여기서 예외 재발생)
+                page_data, called_at, fetch_error = future.result()
+                if fetch_error is not None:
+                    raise fetch_error
+                rows = page_data["rows"]
+                attempted_rows = len(rows)
+
+                # Call Log 기록 (API 호출 성공, worker에서 기록한 실제 API 호출 시각)
+                call_log_entries.append((snapshot_id, start, end, called_at, "success"))
+                fetched = True
+
+                # snapshot 트랜잭션이 이미 전체 rollback된 경우 적재하지 않음
+                # (autocommit 연결이라 적재하면 이 페이지만 단독으로 반영됨)
+                if aborted_error is not None:
+                    raise RuntimeError(aborted_error)
+
+                # 해당 페이지의 rows만 Raw ingest 함수에 넘겨 DB 적재
+                _execute_savepoint_sql(mysql_conn, f"SAVEPOINT page_{start}")
+                ingest_result = ingest_rows_page(
                     mysql_conn=mysql_conn,
                     snapshot_id=snapshot_id,
+                    collected_at=snapshot_collected_at,
                     page_start=start,
                     page_end=end,
-                    called_at=called_at,
-                    status="error",
+                    rows=rows,
                 )
-            except Exception:
-                # Call Log 기록 실패는 무시 (원래 예외가 더 중요)
-                pass
-
-            # 페이지 실패 시 rollback (그 페이지 insert만 롤백)
-            mysql_conn.rollback()
-            page_result["status"] = "error"
-            page_result["error"] = str(e)
 
-            # page 4 실패 시 로그만 남기고 계속 진행 (snapshot은 page 1~3 결과로 생성)
-            if start == 3000 and end == 3999:
-                logger.warning(
-                    "page 4 호출 실패, page 1~3 결과만으로 snapshot 생성",
-                    extra={
-                        "structured_data": json.dumps({
-                            "snapshot_time": snapshot_time,
-                            "error": str(e),
-                        })
-                    },
-                )
+                page_result.attempted_rows = attempted_rows
+                page_result.inserted_rows = ingest_result["inserted_rows"]
+                page_result.skipped_duplicates = ingest_result["skipped_duplicates"]
+
+                # page 4 호출 성공 여부 추적
+                if start == 3000 and end == 3999:
+                    page_4_success = True
+
+            except Exception as e:
+                # API 호출 실패 시 Call Log 기록 (error, worker에서 기록한 실제 API 호출 시도 시각)
+                # future.result()는 예외를 던지지 않으므로 called_at은 항상 설정되어 있음
+                if not fetched:
+                    call_log_entries.append((snapshot_id, start, end, called_at, "error"))
+                elif aborted_error is None:
+                    # 적재 실패 시 SAVEPOINT까지만 롤백 (그 페이지 insert만 롤백)
+                    aborted_error = _rollback_to_page_savepoint(mysql_conn, start)
+                page_result.status = "error"
+                page_result.error = str(e)
+
+                # page 4 실패 시 로그만 남기고 계속 진행 (snapshot은 page 1~3 결과로 생성)
+                if start == 3000 and end == 3999:
+                    logger.warning(
+                        "page 4 호출 실패, page 1~3 결과만으로 snapshot 생성",
+                        extra={
+                            "structured_data": json.dumps({
+                                "snapshot_time": snapshot_time,
+                                "error": str(e),
+                            })
+                        },
+                    )
 
-        pages_result.append(page_result)
+            pages_result.append(page_result)
 
-    # 최종 summary 계산
-    attempted_total = sum(p["attempted_rows"] for p in pages_result)
-    inserted_total = sum(p["inserted_rows"] for p in pages_result)
-    duplicates_total = sum(p["skipped_duplicates"] for p in pages_result)
-    errors_total = sum(1 for p in pages_result if p["status"] == "error")
+    # snapshot 전체 1회 commit (이미 전체 rollback된 경우 생략)
+    if aborted_error is None:
+        try:
+            mysql_conn.commit()
+        except Exception as e:
+            mysql_conn.rollback()
+            aborted_error = f"snapshot commit 실패: {e}"
+
+    if aborted_error is not None:
+        # 이번 snapshot의 모든 적재가 반영되지 않으므로 성공 페이지도 error 처리
+        for page_result in pages_result:
+            if page_result.status == "ok":
+                page_result.status = "error"
+                page_result.inserted_rows = 0
+                page_result.skipped_duplicates = 0
+                page_result.error = aborted_error
+
+    # Call Log 일괄 기록 (snapshot당 multi-row INSERT 1회)
+    # 데이터 트랜잭션이 끝난 뒤 autocommit 단독 INSERT로 기록하여
+    # snapshot commit/rollback 결과와 무관하게 실제 API 호출 기록(Budget 근거)을 남긴다
+    try:
+        insert_call_logs(mysql_conn=mysql_conn, entries=call_log_entries)
+    except Exception as e:
+        logger.error(
+            "Call Log 기록 실패",
+            extra={
+                "structured_data": json.dumps({
+                    "snapshot_time": snapshot_time,
+                    "error": str(e),
+                })
+            },
+        )
+
+    # 최종 summary 계산 (pages_result 1회 순회)
+    attempted_total = inserted_total = duplicates_total = errors_total = 0
+    for p in pages_result:
+        attempted_total += p.attempted_rows
+        inserted_total += p.inserted_rows
+        duplicates_total += p.skipped_duplicates
+        if p.status == "error":
+            errors_total += 1
 
     # status 결정
     if errors_total == 0:
@@ -282,39 +386,40 @@ def run_snapshot_once(
     # [호출 수 개념 분리]
     # attempted_pages: 실제 호출을 시도한 페이지 수 (page 1 포함)
     attempted_pages = len(pages_result)
-    # success_pages: HTTP 성공 및 파싱 성공한 호출 수
-    success_pages = len([p for p in pages_result if p["status"] == "ok"])
+    # success_pages: HTTP 성공 및 파싱 성공한 호출 수 (status는 ok/error 둘 중 하나)
+    success_pages = attempted_pages - errors_total
 
     # 최종 구조화 로그 기록
     # call_ranges 제공 여부에 따라 로그 필드 분리
     # [규칙] decided_page_count는 재계산하지 않음, 정의된 값을 그대로 사용
-    if call_ranges is None:
-        # 정책 판단 실행: decided_page_count, totalCount 포함
-        log_data = {
-            "snapshot_time": snapshot_time,
-            "totalCount": total_count,
-            "decided_page_count": decided_page_count,  # 3 or 4
-            "attempted_pages": attempted_pages,
-            "success_pages": success_pages,
-            "page_4_attempted": page_4_attempted if "page_4_attempted" in locals() else False,
-            "page_4_success": page_4_success if "page_4_success" in locals() else False,
-        }
-    else:
-        # 외부 명시 호출: decided_page_count, totalCount 절대 로그 금지
-        log_data = {
-            "snapshot_time": snapshot_time,
-            "attempted_pages": attempted_pages,
-            "success_pages": success_pages,
-            "page_4_attempted": page_4_attempted if "page_4_attempted" in locals() else False,
-            "page_4_success": page_4_success if "page_4_success" in locals() else False,
-        }
-    
-    logger.info("API 호출 완료", extra={"structured_data": json.dumps(log_data)})
+    # INFO 비활성 시 log_data 구성/JSON 직렬화 자체를 생략
+    if logger.isEnabledFor(logging.INFO):
+        if call_ranges is None:
+            # 정책 판단 실행: decided_page_count, totalCount 포함
+            log_data = {
+                "snapshot_time": snapshot_time,
+                "totalCount": total_count,
+                "decided_page_count": decided_page_count,  # 3 or 4
+                "attempted_pages": attempted_pages,
+                "success_pages": success_pages,
+                "page_4_attempted": page_4_attempted if "page_4_attempted" in locals() else False,
+                "page_4_success": page_4_success if "page_4_success" in locals() else False,
+            }
+        else:
+            # 외부 명시 호출: decided_page_count, totalCount 절대 로그 금지
+            log_data = {
+                "snapshot_time": snapshot_time,
+                "attempted_pages": attempted_pages,
+                "success_pages": success_pages,
+                "page_4_attempted": page_4_attempted if "page_4_attempted" in locals() else False,
+                "page_4_success": page_4_success if "page_4_success" in locals() else False,
+            }
+        logger.info("API 호출 완료", extra={"structured_data": json.dumps(log_data)})
 
     return {
         "snapshot_id": snapshot_id,
         "ranges": call_ranges if call_ranges else [],
-        "pages": pages_result,
+        "pages": [p.to_dict() for p in pages_result],
         "attempted_total": attempted_total,
         "inserted_total": inserted_total,
         "duplicates_total": duplicates_total,
@@ -1,8 +1,9 @@
 """시간대 기반 수집 스케줄러 (순수 로직)."""
 
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import datetime
 
-import pytz
+from ingestion.tz import SEOUL_TZ
 
 # 시간대별 수집 주기 정책 (권장 수집 간격)
 # 주의: interval_seconds는 권장 수집 간격이며, sleep이나 loop가 아닙니다.
@@ -10,6 +11,40 @@ import pytz
 COMMUTE_INTERVAL_SECONDS = 120  # 출근/퇴근 시간대: 2분
 NORMAL_INTERVAL_SECONDS = 900  # 일반 시간대: 15분
 
+# 시간대 경계 (자정 기준 경과 초, 양 끝 포함)
+# 출근: 07:00:00 ~ 09:30:00
+MORNING_START = 7 * 3600
+MORNING_END = 9 * 3600 + 30 * 60
+# 퇴근: 17:30:00 ~ 20:00:00
+EVENING_START = 17 * 3600 + 30 * 60
+EVENING_END = 20 * 3600
+# 심야: 00:30:00 ~ 05:00:00
+NIGHT_START = 30 * 60
+NIGHT_END = 5 * 3600
+# 심야 종료 후 첫 수집 가능 시각 (05:00:01, 자정 기준 경과 초)
+_NIGHT_WAKEUP_SECONDS = NIGHT_END + 1
+
+# bisect용 경계 배열: 각 구간 시작과 (종료 + 1)을 오름차순으로 나열
+# bisect_right(_BUCKET_BOUNDARIES, time_seconds)가 _BUCKETS 인덱스가 됨
+# NOTE: 판단은 C 구현 bisect 1회 + 정수 연산뿐이라 Numba 등 JIT 대상이 아님
+#       (tick당 1회 호출, JIT import/컴파일 비용이 판단 비용보다 큼)
+_BUCKET_BOUNDARIES = (
+    NIGHT_START,
+    NIGHT_END + 1,
+    MORNING_START,
+    MORNING_END + 1,
+    EVENING_START,
+    EVENING_END + 1,
+)
+_BUCKETS = ("normal", "night", "normal", "morning", "normal", "evening", "normal")
+
+# 수집 시간대별 권장 수집 간격 (심야는 시각에 따라 달라지므로 제외)
+_COLLECT_INTERVALS = {
+    "morning": COMMUTE_INTERVAL_SECONDS,
+    "evening": COMMUTE_INTERVAL_SECONDS,
+    "normal": NORMAL_INTERVAL_SECONDS,
+}
+
 
 def decide_collection(
     *,
@@ -40,77 +75,32 @@ def decide_collection(
         - 심야: should_collect=False, interval_seconds=심야 종료까지 남은 초
     """
     # Asia/Seoul timezone으로 변환
-    seoul_tz = pytz.timezone("Asia/Seoul")
     if now.tzinfo is None:
         raise ValueError("now는 timezone-aware datetime이어야 합니다")
-    now_seoul = now.astimezone(seoul_tz)
-
-    # 시/분/초 추출
-    hour = now_seoul.hour
-    minute = now_seoul.minute
-    second = now_seoul.second
-    time_seconds = hour * 3600 + minute * 60 + second
-
-    # 시간대 판단
-    # 출근: 07:00:00 ~ 09:30:00
-    morning_start = 7 * 3600  # 07:00:00
-    morning_end = 9 * 3600 + 30 * 60  # 09:30:00
-
-    # 퇴근: 17:30:00 ~ 20:00:00
-    evening_start = 17 * 3600 + 30 * 60  # 17:30:00
-    evening_end = 20 * 3600  # 20:00:00
-
-    # 심야: 00:30:00 ~ 05:00:00
-    night_start = 30 * 60  # 00:30:00
-    night_end = 5 * 3600  # 05:00:00
-
-    # 심야 판단 (날짜 경계 주의)
-    # 00:30:00 ~ 05:00:00 사이가 심야
-    if night_start <= time_seconds <= night_end:
-        time_bucket = "night"
-        should_collect = False
-        # 다음 수집 가능 시각은 05:00:01
-        next_collect_time = now_seoul.replace(
-            hour=5, minute=0, second=1, microsecond=0
-        )
-        if now_seoul >= next_collect_time:
-            # 이미 05:00:01 이후라면 다음날 05:00:01
-            next_collect_time = next_collect_time + timedelta(days=1)
-        interval_seconds = int((next_collect_time - now_seoul).total_seconds())
-        return {
-            "should_collect": should_collect,
-            "interval_seconds": interval_seconds,
-            "time_bucket": time_bucket,
-        }
+    now_seoul = now.astimezone(SEOUL_TZ)
 
-    # 출근 시간대 판단
-    if morning_start <= time_seconds <= morning_end:
-        time_bucket = "morning"
-        should_collect = True
-        interval_seconds = COMMUTE_INTERVAL_SECONDS
-        return {
-            "should_collect": should_collect,
-            "interval_seconds": interval_seconds,
-            "time_bucket": time_bucket,
-        }
+    # 자정 기준 경과 초 (시간대 경계는 모듈 상수와 비교)
+    time_seconds = now_seoul.hour * 3600 + now_seoul.minute * 60 + now_seoul.second
+
+    # 시간대 판단: 정렬된 경계 배열에서 이진 탐색
+    time_bucket = _BUCKETS[bisect_right(_BUCKET_BOUNDARIES, time_seconds)]
 
-    # 퇴근 시간대 판단
-    if evening_start <= time_seconds <= evening_end:
-        time_bucket = "evening"
-        should_collect = True
-        interval_seconds = COMMUTE_INTERVAL_SECONDS
+    # 심야 (00:30:00 ~ 05:00:00, 날짜 경계 주의)
+    if time_bucket == "night":
+        # 다음 수집 가능 시각은 05:00:01 (심야 구간은 항상 그 이전이므로 같은 날)
+        # 정수 초 차이에서 microsecond가 있으면 1초 빼서 기존 int(total_seconds()) 절사와 일치
+        interval_seconds = (
+            _NIGHT_WAKEUP_SECONDS - time_seconds - (1 if now_seoul.microsecond else 0)
+        )
         return {
-            "should_collect": should_collect,
+            "should_collect": False,
             "interval_seconds": interval_seconds,
             "time_bucket": time_bucket,
         }
 
-    # 일반 시간대
-    time_bucket = "normal"
-    should_collect = True
-    interval_seconds = NORMAL_INTERVAL_SECONDS
+    # 출근/퇴근/일반 시간대
     return {
-        "should_collect": should_collect,
-        "interval_seconds": interval_seconds,
+        "should_collect": True,
+        "interval_seconds": _COLLECT_INTERVALS[time_bucket],
         "time_bucket": time_bucket,
     }
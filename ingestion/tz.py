@@ -0,0 +1,9 @@
+"""공용 타임존 상수.
+
+Asia/Seoul tzinfo를 모듈 로드 시 한 번만 생성하여 모든 모듈에서 공유한다.
+(zoneinfo는 C 구현이며 localize/normalize 없이 astimezone/replace로 사용)
+"""
+
+from zoneinfo import ZoneInfo
+
+SEOUL_TZ = ZoneInfo("Asia/Seoul")
@@ -0,0 +1,26 @@
+"""호출 범위 문자열 파싱 유틸 (step4/step7 스크립트 공용)."""
+
+
+def parse_ranges(ranges_str: str) -> list[tuple[int, int]]:
+    """
+    범위 문자열을 파싱.
+
+    예: "0-999,1000-1999,2000-2999" -> [(0, 999), (1000, 1999), (2000, 2999)]
+
+    Args:
+        ranges_str: 콤마로 구분된 "start-end" 목록
+
+    Returns:
+        (start, end) 튜플 리스트 (입력 순서 유지)
+
+    Raises:
+        ValueError: "-"가 없는 항목 또는 정수가 아닌 값
+    """
+    ranges = []
+    for range_str in ranges_str.split(","):
+        # int()가 앞뒤 공백을 허용하므로 별도 strip 불필요
+        start_str, sep, end_str = range_str.partition("-")
+        if not sep:
+            raise ValueError(f"잘못된 범위 형식: {range_str.strip()}")
+        ranges.append((int(start_str), int(end_str)))
+    return ranges
@@ -0,0 +1,21 @@
+"""SQL 문자열 조립 유틸 (multi-row VALUES INSERT 공용)."""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def values_clause(row_placeholder: str, n_rows: int) -> str:
+    """
+    row placeholder를 n_rows개 이어 붙인 VALUES 절 반환 (row 수별로 캐시).
+
+    예: values_clause("(%s, %s)", 2) -> "(%s, %s), (%s, %s)"
+
+    Args:
+        row_placeholder: row 1개의 placeholder 문자열 (예: "(%s, %s, %s)")
+        n_rows: row 수
+
+    NOTE:
+        row 수는 페이지 수(3~4), chunk 크기(RAW_INSERT_CHUNK_SIZE)와 마지막 chunk
+        정도로 종류가 적으므로, 같은 길이의 문자열을 매번 다시 만들지 않는다.
+    """
+    return ", ".join([row_placeholder] * n_rows)
@@ -21,6 +21,19 @@ sys.path.insert(0, str(project_root))
 from ingestion.providers.seoul_subway import SeoulSubwayArrivalProvider  # noqa: E402
 
 
+def _parse_row_num(row: dict[str, str]) -> int | None:
+    """
+    row의 rowNum을 정수로 변환 (없거나 숫자가 아니면 None).
+
+    예외 처리 대신 isdecimal()로 먼저 거른다.
+    (isdigit()은 '²' 같은 int() 변환 불가 문자도 True이므로 사용하지 않음)
+    """
+    row_num_str = row.get("rowNum", "")
+    if row_num_str.isdecimal():
+        return int(row_num_str)
+    return None
+
+
 def main() -> None:
     """메인 실행 함수."""
     # 최상위 .env 로드
@@ -70,24 +83,36 @@ def main() -> None:
     print(f"전체 row 수 (3회 호출 결과 합): {len(all_rows)}")
     print()
 
-    # rowNum 값 분포
-    row_nums = []
+    # rowNum / statnNm / subwayId 통계를 all_rows 1회 순회로 함께 집계
+    # (NumPy 미사용: 수천 row 규모에서는 dict → 배열 변환 비용이 집계 비용보다 큼)
+    row_num_counter: Counter[int] = Counter()
+    statn_nm_counter: Counter[str] = Counter()
+    subway_id_counter: Counter[str] = Counter()
+    row_num_min: int | None = None
+    row_num_max: int | None = None
     for row in all_rows:
-        row_num_str = row.get("rowNum", "")
-        if row_num_str:
-            try:
-                row_nums.append(int(row_num_str))
-            except ValueError:
-                pass
-
-    if row_nums:
+        row_num = _parse_row_num(row)
+        if row_num is not None:
+            row_num_counter[row_num] += 1
+            if row_num_min is None or row_num < row_num_min:
+                row_num_min = row_num
+            if row_num_max is None or row_num > row_num_max:
+                row_num_max = row_num
+        statn_nm = row.get("statnNm")
+        if statn_nm:
+            statn_nm_counter[statn_nm] += 1
+        subway_id = row.get("subwayId")
+        if subway_id:
+            subway_id_counter[subway_id] += 1
+
+    # rowNum 값 분포
+    if row_num_counter:
         print("rowNum 값 분포:")
-        print(f"  min: {min(row_nums)}")
-        print(f"  max: {max(row_nums)}")
+        print(f"  min: {row_num_min}")
+        print(f"  max: {row_num_max}")
         print()
 
         # rowNum 중복 여부
-        row_num_counter = Counter(row_nums)
         duplicates = {num: count for num, count in row_num_counter.items() if count > 1}
         if duplicates:
             print("rowNum 중복 발견:")
@@ -103,8 +128,6 @@ def main() -> None:
     # [3] 역(statnNm) 분포
     print("[3] 역(statnNm) 분포")
     print("-" * 80)
-    statn_nms = [row.get("statnNm", "") for row in all_rows if row.get("statnNm")]
-    statn_nm_counter = Counter(statn_nms)
     unique_statn_nms = len(statn_nm_counter)
     print(f"고유 statnNm 개수: {unique_statn_nms}")
     print()
@@ -124,9 +147,7 @@ def main() -> None:
     # [4] 노선(subwayId) 분포
     print("[4] 노선(subwayId) 분포")
     print("-" * 80)
-    subway_ids = [row.get("subwayId", "") for row in all_rows if row.get("subwayId")]
-    subway_id_counter = Counter(subway_ids)
-    unique_subway_ids = sorted(set(subway_ids))
+    unique_subway_ids = sorted(subway_id_counter)
     print(f"고유 subwayId 목록: {unique_subway_ids}")
     print()
     print("subwayId별 row 개수:")
@@ -142,16 +163,18 @@ def main() -> None:
     if not all_rows:
         print("row가 없어서 필드 구조를 확인할 수 없습니다.")
     else:
-        first_row_keys = set(all_rows[0].keys())
+        # Provider가 계산해 둔 frozenset 재사용
+        first_row_keys = result.first_row_keys
         print(f"첫 row의 key 개수: {len(first_row_keys)}")
         print(f"첫 row의 key 목록: {sorted(first_row_keys)}")
         print()
 
         # key 개수가 다른 row 찾기
+        # dict keys view를 frozenset과 바로 비교하여 정상 row에서는 set을 만들지 않음
         inconsistent_rows = []
         for idx, row in enumerate(all_rows):
-            row_keys = set(row.keys())
-            if row_keys != first_row_keys:
+            if row.keys() != first_row_keys:
+                row_keys = set(row.keys())
                 missing_keys = first_row_keys - row_keys
                 extra_keys = row_keys - first_row_keys
                 row_num = row.get("rowNum", f"인덱스{idx}")
@@ -187,12 +210,8 @@ def main() -> None:
     # rowNum으로 정렬 가능한 row 찾기
     sortable_rows = []
     for idx, row in enumerate(all_rows):
-        row_num_str = row.get("rowNum", "")
-        try:
-            row_num = int(row_num_str) if row_num_str else idx
-            sortable_rows.append((row_num, idx, row))
-        except ValueError:
-            sortable_rows.append((idx, idx, row))
+        row_num = _parse_row_num(row)
+        sortable_rows.append((idx if row_num is None else row_num, idx, row))
 
     # rowNum 기준으로 정렬
     sortable_rows.sort(key=lambda x: x[0])
@@ -1,7 +1,7 @@
 """STEP 3 실행 스크립트: Raw 데이터 적재.
 
 필수 패키지 설치:
-    pip install pymysql python-dotenv pytz
+    pip install pymysql python-dotenv
 
 또는 requirements.txt 사용:
     pip install -r requirements.txt
@@ -11,13 +11,14 @@ import os
 import sys
 from pathlib import Path
 
-import pymysql
 from dotenv import load_dotenv  # noqa: E402
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from ingestion.config import DBConfig  # noqa: E402
+from ingestion.db.connection import connect  # noqa: E402
 from ingestion.pipeline.raw_ingest import (  # noqa: E402
     generate_snapshot_id,
     ingest_provider_result,
@@ -37,29 +38,14 @@ def main() -> None:
         print("ERROR: SEOUL_SUBWAY_API_KEY가 .env에 없습니다.", file=sys.stderr)
         sys.exit(1)
 
-    # MySQL 접속 정보
-    mysql_host = os.getenv("MYSQL_HOST", "localhost")
-    mysql_port = int(os.getenv("MYSQL_PORT", "3306"))
-    mysql_user = os.getenv("MYSQL_USER", "root")
-    mysql_password = os.getenv("MYSQL_PASSWORD", "")
-    mysql_database = os.getenv("MYSQL_DATABASE", "mcp_subway")
-
     print("=" * 80)
     print("STEP 3: Raw 데이터 적재 파이프라인")
     print("=" * 80)
     print()
 
-    # MySQL 연결
+    # MySQL 연결 (단발 실행이므로 연결 1개, 접속 정보는 .env의 MYSQL_* 사용)
     try:
-        mysql_conn = pymysql.connect(
-            host=mysql_host,
-            port=mysql_port,
-            user=mysql_user,
-            password=mysql_password,
-            database=mysql_database,
-            charset="utf8mb4",
-            autocommit=False,  # 명시적 commit 사용
-        )
+        mysql_conn = connect(DBConfig.from_env())
         print("✓ MySQL 연결 성공")
     except Exception as e:
         print(f"ERROR: MySQL 연결 실패: {e}", file=sys.stderr)
@@ -1,7 +1,7 @@
 """STEP 4 실행 스크립트: Snapshot Runner 단발 실행.
 
 필수 패키지 설치:
-    pip install pymysql python-dotenv pytz requests
+    pip install pymysql python-dotenv requests
 
 또는 requirements.txt 사용:
     pip install -r requirements.txt
@@ -13,34 +13,19 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-import pymysql
-import pytz
 from dotenv import load_dotenv  # noqa: E402
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from ingestion.config import DBConfig  # noqa: E402
+from ingestion.db.connection import connect  # noqa: E402
 from ingestion.pipeline.raw_ingest import generate_snapshot_id  # noqa: E402
 from ingestion.providers.seoul_subway import SeoulSubwayArrivalProvider  # noqa: E402
 from ingestion.runner.snapshot_runner import run_snapshot_once  # noqa: E402
-
-
-def parse_ranges(ranges_str: str) -> list[tuple[int, int]]:
-    """
-    범위 문자열을 파싱.
-
-    예: "0-999,1000-1999,2000-2999" -> [(0, 999), (1000, 1999), (2000, 2999)]
-    """
-    ranges = []
-    for range_str in ranges_str.split(","):
-        range_str = range_str.strip()
-        if "-" in range_str:
-            start_str, end_str = range_str.split("-", 1)
-            ranges.append((int(start_str.strip()), int(end_str.strip())))
-        else:
-            raise ValueError(f"잘못된 범위 형식: {range_str}")
-    return ranges
+from ingestion.tz import SEOUL_TZ  # noqa: E402
+from ingestion.util.ranges import parse_ranges  # noqa: E402
 
 
 def main() -> None:
@@ -92,26 +77,12 @@ def main() -> None:
         sys.exit(1)
     provider = SeoulSubwayArrivalProvider(api_key=api_key)
 
-    # MySQL 연결 생성 (CLI에서만 허용)
-    mysql_host = os.getenv("MYSQL_HOST", "localhost")
-    mysql_port = int(os.getenv("MYSQL_PORT", "3306"))
-    mysql_user = os.getenv("MYSQL_USER", "root")
-    mysql_password = os.getenv("MYSQL_PASSWORD", "")
-    mysql_database = os.getenv("MYSQL_DATABASE", "mcp_subway")
-
-    mysql_conn = pymysql.connect(
-        host=mysql_host,
-        port=mysql_port,
-        user=mysql_user,
-        password=mysql_password,
-        database=mysql_database,
-        charset="utf8mb4",
-        autocommit=False,
-    )
+    # MySQL 연결 생성 (CLI에서만 허용, 단발 실행이므로 연결 1개)
+    mysql_conn = connect(DBConfig.from_env())
 
-    # clock 함수 정의 (DI)
+    # clock 함수 정의 (DI, 모듈 상수 SEOUL_TZ 재사용)
     def clock() -> datetime:
-        return datetime.now(pytz.timezone("Asia/Seoul"))
+        return datetime.now(SEOUL_TZ)
 
     try:
         # Snapshot 실행
@@ -128,20 +99,24 @@ def main() -> None:
         print(f"status: {result['status']}")
         print()
 
-        # 페이지별 결과 테이블
-        print("페이지별 결과:")
-        print("-" * 80)
-        print(f"{'Start':<10} {'End':<10} {'Status':<10} {'Attempted':<12} {'Inserted':<12} {'Duplicates':<12} {'Error':<30}")
-        print("-" * 80)
+        # 페이지별 결과 테이블 (행을 모두 만든 뒤 print 1회로 출력)
+        separator = "-" * 80
+        table_lines = [
+            "페이지별 결과:",
+            separator,
+            f"{'Start':<10} {'End':<10} {'Status':<10} {'Attempted':<12} {'Inserted':<12} {'Duplicates':<12} {'Error':<30}",
+            separator,
+        ]
         for page in result["pages"]:
-            error_msg = page["error"][:28] + "..." if page["error"] and len(page["error"]) > 30 else (page["error"] or "")
-            print(
+            error = page["error"] or ""
+            error_msg = error[:28] + "..." if len(error) > 30 else error
+            table_lines.append(
                 f"{page['start']:<10} {page['end']:<10} {page['status']:<10} "
                 f"{page['attempted_rows']:<12} {page['inserted_rows']:<12} "
                 f"{page['skipped_duplicates']:<12} {error_msg:<30}"
             )
-        print("-" * 80)
-        print()
+        table_lines.append(separator)
+        print("\n".join(table_lines) + "\n")
 
         # 전체 요약
         print("전체 요약:")
@@ -158,20 +133,14 @@ def main() -> None:
 
         cursor = mysql_conn.cursor()
 
-        # COUNT 쿼리
+        # COUNT/MIN/MAX를 한 쿼리로 조회 (같은 snapshot_id 조건, 왕복 1회)
         cursor.execute(
-            "SELECT COUNT(*) FROM subway_arrival_raw WHERE snapshot_id = %s",
+            "SELECT COUNT(*), MIN(created_at), MAX(created_at) "
+            "FROM subway_arrival_raw WHERE snapshot_id = %s",
             (result["snapshot_id"],),
         )
-        count = cursor.fetchone()[0]
+        count, min_created, max_created = cursor.fetchone()
         print(f"COUNT(*) WHERE snapshot_id = '{result['snapshot_id']}': {count}")
-
-        # MIN/MAX 쿼리
-        cursor.execute(
-            "SELECT MIN(created_at), MAX(created_at) FROM subway_arrival_raw WHERE snapshot_id = %s",
-            (result["snapshot_id"],),
-        )
-        min_created, max_created = cursor.fetchone()
         print(f"MIN(created_at): {min_created}")
         print(f"MAX(created_at): {max_created}")
 
@@ -1,7 +1,7 @@
 """STEP 7 실행 스크립트: Orchestrator 단발 실행.
 
 필수 패키지 설치:
-    pip install pymysql python-dotenv pytz requests
+    pip install pymysql python-dotenv requests
 
 또는 requirements.txt 사용:
     pip install -r requirements.txt
@@ -10,45 +10,31 @@
 import argparse
 import os
 import sys
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 
-import pymysql
-import pytz
 from dotenv import load_dotenv  # noqa: E402
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from ingestion.config import DBConfig  # noqa: E402
+from ingestion.db.connection import connect  # noqa: E402
 from ingestion.orchestrator import run_orchestrator_once  # noqa: E402
 from ingestion.providers.seoul_subway import SeoulSubwayArrivalProvider  # noqa: E402
+from ingestion.scheduler import decide_collection  # noqa: E402
+from ingestion.tz import SEOUL_TZ  # noqa: E402
+from ingestion.util.ranges import parse_ranges  # noqa: E402
 
 
-def parse_ranges(ranges_str: str) -> list[tuple[int, int]]:
-    """
-    범위 문자열을 파싱.
-
-    예: "0-999,1000-1999,2000-2999" -> [(0, 999), (1000, 1999), (2000, 2999)]
-    """
-    ranges = []
-    for range_str in ranges_str.split(","):
-        range_str = range_str.strip()
-        if "-" in range_str:
-            start_str, end_str = range_str.split("-", 1)
-            ranges.append((int(start_str.strip()), int(end_str.strip())))
-        else:
-            raise ValueError(f"잘못된 범위 형식: {range_str}")
-    return ranges
-
-
-def get_used_calls_today(mysql_conn, today: datetime) -> int:
+def get_used_calls_today(mysql_conn, today: date) -> int:
     """
     오늘 사용한 호출 수 조회.
 
     Args:
         mysql_conn: MySQL 연결 객체
-        today: 오늘 날짜 (Asia/Seoul 기준)
+        today: 오늘 날짜 (Asia/Seoul 기준, 드라이버가 DATE 리터럴로 변환)
 
     Returns:
         오늘 사용한 호출 수 (success 상태만 카운트)
@@ -56,20 +42,20 @@ def get_used_calls_today(mysql_conn, today: datetime) -> int:
     STEP 8.5 DONE:
     Budget 계산은 subway_api_call_log를
     API 호출 횟수의 단일 진실 소스로 사용한다.
-    """
-    # 날짜를 YYYY-MM-DD 형식으로 변환
-    date_str = today.strftime("%Y-%m-%d")
 
+    NOTE:
+        - (call_date, status) 인덱스(idx_call_date_status)만 읽는 COUNT(*)
+    """
     cursor = mysql_conn.cursor()
     try:
         # Call Log 테이블 기준으로 오늘 날짜의 success 호출 수 계산
         sql = """
-        SELECT COUNT(*) AS call_count
+        SELECT COUNT(*)
         FROM subway_api_call_log
         WHERE call_date = %s
           AND status = 'success'
         """
-        cursor.execute(sql, (date_str,))
+        cursor.execute(sql, (today,))
         result = cursor.fetchone()
         return result[0] if result else 0
     finally:
@@ -108,6 +94,21 @@ def main() -> None:
     # call_ranges 기본값: None이면 Runner에서 동적으로 결정 (totalCount 기반)
     # call_ranges를 명시적으로 전달하면 그대로 사용 (기존 동작 유지)
 
+    # clock 함수 정의 (DI)
+    def clock() -> datetime:
+        return datetime.now(SEOUL_TZ)
+
+    # 현재 시각
+    now = clock()
+
+    # 시간대 정책 선확인: 차단 시간대 tick은 Provider/DB 연결 없이 종료
+    # (Orchestrator도 같은 decide_collection으로 다시 판단하므로 정책은 한 곳에만 존재)
+    if not decide_collection(now=now)["should_collect"]:
+        print(f"현재 시각: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
+        print("executed: False")
+        print("reason: time_policy_blocked")
+        sys.exit(1)
+
     # Provider 생성 (CLI에서만 허용)
     api_key = os.getenv("SEOUL_SUBWAY_API_KEY")
     if not api_key:
@@ -115,35 +116,18 @@ def main() -> None:
         sys.exit(1)
     provider = SeoulSubwayArrivalProvider(api_key=api_key)
 
-    # MySQL 연결 생성 (CLI에서만 허용)
-    mysql_host = os.getenv("MYSQL_HOST", "localhost")
-    mysql_port = int(os.getenv("MYSQL_PORT", "3306"))
-    mysql_user = os.getenv("MYSQL_USER", "root")
-    mysql_password = os.getenv("MYSQL_PASSWORD", "")
-    mysql_database = os.getenv("MYSQL_DATABASE", "mcp_subway")
-
-    mysql_conn = pymysql.connect(
-        host=mysql_host,
-        port=mysql_port,
-        user=mysql_user,
-        password=mysql_password,
-        database=mysql_database,
-        charset="utf8mb4",
-        autocommit=False,
-    )
-
-    # clock 함수 정의 (DI)
-    seoul_tz = pytz.timezone("Asia/Seoul")
-
-    def clock() -> datetime:
-        return datetime.now(seoul_tz)
+    # MySQL 연결 생성 (CLI에서만 허용, tick당 1프로세스이므로 연결 1개)
+    mysql_conn = connect(DBConfig.from_env())
 
     try:
-        # 현재 시각
-        now = clock()
+        # snapshot_id는 now에서 한 번만 만들어 Orchestrator로 전달
+        snapshot_id = (
+            f"{now.year:04d}{now.month:02d}{now.day:02d}_"
+            f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+        )
 
         # 오늘 사용한 호출 수 조회
-        used_calls_today = get_used_calls_today(mysql_conn, now)
+        used_calls_today = get_used_calls_today(mysql_conn, now.date())
 
         print(f"현재 시각: {now.strftime('%Y-%m-%d %H:%M:%S %Z')}")
         print(f"오늘 사용한 호출 수: {used_calls_today}")
@@ -161,6 +145,7 @@ def main() -> None:
             mysql_conn=mysql_conn,
             clock=clock,
             used_calls_today=used_calls_today,
+            snapshot_id=snapshot_id,
         )
 
         # 결과 출력
@@ -210,8 +195,9 @@ def main() -> None:
         print(f"ERROR: {e}", file=sys.stderr)
         sys.exit(1)
     finally:
-        # MySQL 연결 종료 (CLI에서만 허용)
+        # MySQL 연결/HTTP 세션 종료 (CLI에서만 허용)
         mysql_conn.close()
+        provider.close()
 
 
 # 이 파일은 Ingestion Plane 내부 실행 유닛입니다.
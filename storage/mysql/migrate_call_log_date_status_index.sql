@@ -0,0 +1,15 @@
+-- ============================================================================
+-- 마이그레이션: subway_api_call_log (call_date, status) 커버링 인덱스
+-- ============================================================================
+-- 목적: Budget 조회(get_used_calls_today)의 COUNT(*)를
+--       클러스터드 인덱스 row 조회 없이 인덱스만으로 처리
+--       (call_date 단독 인덱스는 새 인덱스의 prefix라 제거)
+-- 대상: schema_call_log.sql 변경 이전에 생성된 기존 테이블
+-- ============================================================================
+
+ALTER TABLE subway_api_call_log
+    ADD KEY idx_call_date_status (call_date, status),
+    DROP KEY idx_call_date;
+
+-- 검증: key=idx_call_date_status, Extra=Using index 이어야 함
+-- EXPLAIN SELECT COUNT(*) FROM subway_api_call_log WHERE call_date = CURDATE() AND status = 'success';
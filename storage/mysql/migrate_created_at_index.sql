@@ -0,0 +1,13 @@
+-- ============================================================================
+-- 마이그레이션: subway_arrival_raw.created_at 인덱스 추가
+-- ============================================================================
+-- 목적: Orchestrator의 최근 snapshot 시각 조회(get_last_snapshot_at)를
+--       전체 테이블 스캔 대신 인덱스 끝 1건 조회로 처리
+-- 대상: schema_raw.sql 변경 이전에 생성된 기존 테이블
+-- ============================================================================
+
+ALTER TABLE subway_arrival_raw
+    ADD KEY idx_created_at (created_at);
+
+-- 검증: key=idx_created_at, rows=1 이어야 함
+-- EXPLAIN SELECT created_at FROM subway_arrival_raw ORDER BY created_at DESC LIMIT 1;
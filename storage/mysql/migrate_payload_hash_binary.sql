@@ -0,0 +1,24 @@
+-- ============================================================================
+-- 마이그레이션: subway_arrival_raw.payload_hash CHAR(64) → BINARY(32)
+-- ============================================================================
+-- 목적: hex 문자열(64바이트) 대신 SHA-256 raw digest(32바이트) 저장
+--       → row/UNIQUE 인덱스 크기 절반, INSERT 시 전송 바이트 감소
+-- 대상: schema_raw.sql 변경 이전에 생성된 기존 테이블
+-- 주의: 해시 값 자체는 동일 (UNHEX(기존 hex) == 새 digest), 중복 판정 유지
+-- ============================================================================
+
+ALTER TABLE subway_arrival_raw
+    ADD COLUMN payload_hash_bin BINARY(32) NULL AFTER payload_hash;
+
+UPDATE subway_arrival_raw
+SET payload_hash_bin = UNHEX(payload_hash);
+
+ALTER TABLE subway_arrival_raw
+    DROP INDEX uq_payload_hash,
+    DROP COLUMN payload_hash,
+    CHANGE COLUMN payload_hash_bin payload_hash BINARY(32) NOT NULL
+        COMMENT 'raw_payload를 canonical JSON으로 만든 뒤 SHA-256 raw digest (중복 방지용)',
+    ADD UNIQUE KEY uq_payload_hash (payload_hash);
+
+-- 검증
+-- SELECT COUNT(*) FROM subway_arrival_raw WHERE LENGTH(payload_hash) <> 32;
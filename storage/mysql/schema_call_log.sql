@@ -12,7 +12,7 @@ CREATE TABLE subway_api_call_log (
     called_at DATETIME NOT NULL COMMENT '실제 API 호출 시각 (Asia/Seoul)',
     status VARCHAR(16) NOT NULL COMMENT '호출 결과: success 또는 error',
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    KEY idx_call_date (call_date),
+    KEY idx_call_date_status (call_date, status) COMMENT 'Budget COUNT(*) 커버링 인덱스',
     KEY idx_snapshot (snapshot_id),
     UNIQUE KEY uq_call (snapshot_id, page_start, page_end)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='API 호출 기록 (Budget 계산 단일 진실 소스)';
@@ -19,7 +19,7 @@ CREATE TABLE subway_arrival_raw (
     
     raw_payload JSON NOT NULL COMMENT 'XML <row>를 파싱한 dict 전체 (필드 무손실 보존)',
     
-    payload_hash CHAR(64) NOT NULL COMMENT 'raw_payload를 canonical JSON으로 만든 뒤 SHA-256 해시 (중복 방지용)',
+    payload_hash BINARY(32) NOT NULL COMMENT 'raw_payload를 canonical JSON으로 만든 뒤 SHA-256 raw digest (중복 방지용)',
     
     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '레코드 생성 시각'
 ) ENGINE=InnoDB
@@ -43,6 +43,10 @@ ALTER TABLE subway_arrival_raw
 ALTER TABLE subway_arrival_raw
     ADD KEY idx_collected_at (collected_at);
 
+-- 최근 snapshot 시각 조회용 (Orchestrator가 매 tick 조회)
+ALTER TABLE subway_arrival_raw
+    ADD KEY idx_created_at (created_at);
+
 -- 페이지 범위 조회용
 ALTER TABLE subway_arrival_raw
     ADD KEY idx_page_range (page_start, page_end);
@@ -83,7 +87,7 @@ INSERT INTO subway_arrival_raw (
     0,
     999,
     '{"subwayId": "1001", "statnNm": "서울역", "trainLineNm": "1호선", "rowNum": "1"}',
-    SHA2('{"subwayId": "1001", "statnNm": "서울역", "trainLineNm": "1호선", "rowNum": "1"}', 256)
+    UNHEX(SHA2('{"subwayId": "1001", "statnNm": "서울역", "trainLineNm": "1호선", "rowNum": "1"}', 256))
 );
 
 -- 동일 payload_hash로 재삽입 시도 (UNIQUE 제약으로 실패해야 함)
@@ -100,7 +104,7 @@ INSERT INTO subway_arrival_raw (
     0,
     999,
     '{"subwayId": "1001", "statnNm": "서울역", "trainLineNm": "1호선", "rowNum": "1"}',
-    SHA2('{"subwayId": "1001", "statnNm": "서울역", "trainLineNm": "1호선", "rowNum": "1"}', 256)
+    UNHEX(SHA2('{"subwayId": "1001", "statnNm": "서울역", "trainLineNm": "1호선", "rowNum": "1"}', 256))
 );
 -- 예상 결과: ERROR 1062 (23000): Duplicate entry '...' for key 'uq_payload_hash'
 */
@@ -0,0 +1,49 @@
+"""테스트용 경량 DB-API 연결/커서 (MagicMock 대신 사용).
+
+실행된 SQL과 파라미터만 기록하며, fetchone 결과는 미리 넣어둔 순서대로 반환한다.
+"""
+
+from typing import Any
+
+
+class FakeCursor:
+    """execute 호출을 (sql, params) 튜플로 기록하는 커서."""
+
+    def __init__(self, rowcount: int = 0):
+        self.executed: list[tuple[str, Any]] = []
+        self.fetchone_results: list[Any] = []
+        self.rowcount = rowcount
+        self.closed = 0
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        self.executed.append((sql, params))
+
+    def fetchone(self) -> Any:
+        return self.fetchone_results.pop(0) if self.fetchone_results else None
+
+    def close(self) -> None:
+        self.closed += 1
+
+
+class FakeConn:
+    """항상 같은 FakeCursor를 반환하고 begin/commit/rollback 횟수를 기록하는 연결."""
+
+    def __init__(self, cursor: FakeCursor | None = None):
+        self._cursor = cursor if cursor is not None else FakeCursor()
+        self.cursor_calls = 0
+        self.begins = 0
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self) -> FakeCursor:
+        self.cursor_calls += 1
+        return self._cursor
+
+    def begin(self) -> None:
+        self.begins += 1
+
+    def commit(self) -> None:
+        self.commits += 1
+
+    def rollback(self) -> None:
+        self.rollbacks += 1
@@ -0,0 +1,8 @@
+"""pytest 공통 설정: 프로젝트 루트를 세션 시작 시 한 번만 Python 경로에 추가."""
+
+import sys
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
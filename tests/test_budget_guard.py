@@ -1,14 +1,8 @@
 """Budget Guard 테스트."""
 
-import sys
 from datetime import date
-from pathlib import Path
 
-# 프로젝트 루트를 Python 경로에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from ingestion.budget import check_budget  # noqa: E402
+from ingestion.budget import check_budget
 
 
 def test_budget_ok_cases() -> None:
@@ -1,30 +1,21 @@
 """Call Log 테스트."""
 
-import sys
 from datetime import datetime
-from pathlib import Path
-from unittest.mock import MagicMock
 
-import pytz
-
-# 프로젝트 루트를 Python 경로에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from ingestion.pipeline.call_log import insert_call_log  # noqa: E402
+from ingestion.pipeline.call_log import insert_call_log
+from ingestion.tz import SEOUL_TZ
+from tests._fakes import FakeConn
 
 
 def test_insert_call_log_success() -> None:
     """성공 호출 기록 테스트."""
-    mock_mysql_conn = MagicMock()
-    mock_cursor = MagicMock()
-    mock_mysql_conn.cursor.return_value = mock_cursor
+    conn = FakeConn()
+    cursor = conn._cursor
 
-    seoul_tz = pytz.timezone("Asia/Seoul")
-    called_at = seoul_tz.localize(datetime(2026, 1, 4, 10, 0, 0))
+    called_at = datetime(2026, 1, 4, 10, 0, 0, tzinfo=SEOUL_TZ)
 
     insert_call_log(
-        mysql_conn=mock_mysql_conn,
+        mysql_conn=conn,
         snapshot_id="20260104_100000",
         page_start=0,
         page_end=999,
@@ -33,26 +24,24 @@ def test_insert_call_log_success() -> None:
     )
 
     # INSERT 호출 확인
-    mock_cursor.execute.assert_called_once()
-    call_args = mock_cursor.execute.call_args
-    assert "INSERT INTO subway_api_call_log" in call_args[0][0]
-    assert call_args[0][1][1] == "20260104_100000"  # snapshot_id
-    assert call_args[0][1][2] == 0  # page_start
-    assert call_args[0][1][3] == 999  # page_end
-    assert call_args[0][1][5] == "success"  # status
+    assert len(cursor.executed) == 1
+    sql, params = cursor.executed[0]
+    assert "INSERT INTO subway_api_call_log" in sql
+    assert params[1] == "20260104_100000"  # snapshot_id
+    assert params[2] == 0  # page_start
+    assert params[3] == 999  # page_end
+    assert params[5] == "success"  # status
 
 
 def test_insert_call_log_error() -> None:
     """실패 호출 기록 테스트."""
-    mock_mysql_conn = MagicMock()
-    mock_cursor = MagicMock()
-    mock_mysql_conn.cursor.return_value = mock_cursor
+    conn = FakeConn()
+    cursor = conn._cursor
 
-    seoul_tz = pytz.timezone("Asia/Seoul")
-    called_at = seoul_tz.localize(datetime(2026, 1, 4, 10, 0, 0))
+    called_at = datetime(2026, 1, 4, 10, 0, 0, tzinfo=SEOUL_TZ)
 
     insert_call_log(
-        mysql_conn=mock_mysql_conn,
+        mysql_conn=conn,
         snapshot_id="20260104_100000",
         page_start=1000,
         page_end=1999,
@@ -61,23 +50,20 @@ def test_insert_call_log_error() -> None:
     )
 
     # INSERT 호출 확인
-    mock_cursor.execute.assert_called_once()
-    call_args = mock_cursor.execute.call_args
-    assert call_args[0][1][5] == "error"  # status
+    assert len(cursor.executed) == 1
+    assert cursor.executed[0][1][5] == "error"  # status
 
 
 def test_insert_call_log_duplicate_prevention() -> None:
     """중복 방지 테스트 (ON DUPLICATE KEY UPDATE)."""
-    mock_mysql_conn = MagicMock()
-    mock_cursor = MagicMock()
-    mock_mysql_conn.cursor.return_value = mock_cursor
+    conn = FakeConn()
+    cursor = conn._cursor
 
-    seoul_tz = pytz.timezone("Asia/Seoul")
-    called_at = seoul_tz.localize(datetime(2026, 1, 4, 10, 0, 0))
+    called_at = datetime(2026, 1, 4, 10, 0, 0, tzinfo=SEOUL_TZ)
 
     # 동일 snapshot_id/page_start/page_end로 2회 삽입 시도
     insert_call_log(
-        mysql_conn=mock_mysql_conn,
+        mysql_conn=conn,
         snapshot_id="20260104_100000",
         page_start=0,
         page_end=999,
@@ -86,7 +72,7 @@ def test_insert_call_log_duplicate_prevention() -> None:
     )
 
     insert_call_log(
-        mysql_conn=mock_mysql_conn,
+        mysql_conn=conn,
         snapshot_id="20260104_100000",
         page_start=0,
         page_end=999,
@@ -95,11 +81,10 @@ def test_insert_call_log_duplicate_prevention() -> None:
     )
 
     # 두 번 모두 INSERT 호출됨 (ON DUPLICATE KEY UPDATE로 처리)
-    assert mock_cursor.execute.call_count == 2
+    assert len(cursor.executed) == 2
 
     # SQL에 ON DUPLICATE KEY UPDATE 포함 확인
-    for call in mock_cursor.execute.call_args_list:
-        sql = call[0][0]
+    for sql, _ in cursor.executed:
         assert "ON DUPLICATE KEY UPDATE" in sql
 
 
@@ -122,3 +107,40 @@ def test_call_log_budget_calculation() -> None:
     assert "status" in sql
     assert "success" in sql
     assert "COUNT(*)" in sql
+
+
+def test_insert_call_logs_batch() -> None:
+    """여러 호출 기록이 multi-row VALUES INSERT 1회로 삽입되는지 테스트."""
+    from ingestion.pipeline.call_log import insert_call_logs
+
+    conn = FakeConn()
+    cursor = conn._cursor
+
+    called_at = datetime(2026, 1, 4, 10, 0, 0, tzinfo=SEOUL_TZ)
+
+    insert_call_logs(
+        mysql_conn=conn,
+        entries=[
+            ("20260104_100000", 0, 999, called_at, "success"),
+            ("20260104_100000", 1000, 1999, called_at, "error"),
+        ],
+    )
+
+    # call_log multi-row INSERT 1회 (FakeCursor에는 executemany 없음)
+    assert len(cursor.executed) == 1
+    sql, params = cursor.executed[0]
+    assert sql.count("(%s, %s, %s, %s, %s, %s)") == 2
+    assert "ON DUPLICATE KEY UPDATE" in sql
+    assert tuple(params[:6]) == (
+        called_at.date(), "20260104_100000", 0, 999, called_at, "success"
+    )
+    assert params[11] == "error"
+
+
+def test_insert_call_logs_empty() -> None:
+    """빈 entries는 DB에 접근하지 않아야 함."""
+    from ingestion.pipeline.call_log import insert_call_logs
+
+    conn = FakeConn()
+    insert_call_logs(mysql_conn=conn, entries=[])
+    assert conn.cursor_calls == 0
@@ -0,0 +1,34 @@
+"""MySQL 연결 helper 테스트 (DB 없이)."""
+
+from unittest.mock import patch
+
+from ingestion.config import DBConfig
+from ingestion.db import connection as connection_module
+
+
+def test_connect_sends_bytes_as_binary() -> None:
+    """payload_hash raw digest가 _binary 리터럴로 전송되도록 연결 옵션을 켜야 함."""
+    with patch.object(connection_module.mysql_driver, "connect") as mock_connect:
+        connection_module.connect(DBConfig())
+
+    kwargs = mock_connect.call_args.kwargs
+    assert kwargs["binary_prefix"] is True
+    assert kwargs["charset"] == "utf8mb4"
+    # 조회는 트랜잭션 밖, 쓰기는 begin()으로 명시
+    assert kwargs["autocommit"] is True
+    # 조회 코드는 tuple row(row[0])를 전제하므로 dict cursor로 바꾸지 않음
+    assert "cursorclass" not in kwargs
+
+
+def test_db_config_from_env(monkeypatch) -> None:
+    """MYSQL_* 환경 변수를 한 번에 읽고 포트는 정수로 파싱해야 함."""
+    monkeypatch.setenv("MYSQL_HOST", "db")
+    monkeypatch.setenv("MYSQL_PORT", "3307")
+    monkeypatch.delenv("MYSQL_USER", raising=False)
+
+    config = DBConfig.from_env()
+
+    assert config.host == "db"
+    assert config.port == 3307
+    assert config.user == "root"  # 기본값
+    assert config.as_connect_kwargs()["port"] == 3307
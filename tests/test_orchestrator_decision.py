@@ -1,23 +1,16 @@
 """Orchestrator 실행 판단 테스트."""
 
-import sys
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-import pytz
-
-# 프로젝트 루트를 Python 경로에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from ingestion.orchestrator import run_orchestrator_once  # noqa: E402
+from ingestion.orchestrator import run_orchestrator_once
+from ingestion.tz import SEOUL_TZ
+from tests._fakes import FakeConn
 
 
 def test_time_policy_blocked() -> None:
     """시간대 정책 차단 테스트."""
-    seoul_tz = pytz.timezone("Asia/Seoul")
-    now = seoul_tz.localize(datetime(2026, 1, 4, 2, 0, 0))  # 02:00 (심야)
+    now = datetime(2026, 1, 4, 2, 0, 0, tzinfo=SEOUL_TZ)  # 02:00 (심야)
 
     mock_provider = MagicMock()
     mock_mysql_conn = MagicMock()
@@ -41,8 +34,7 @@ def test_time_policy_blocked() -> None:
 
 def test_budget_blocked() -> None:
     """예산 차단 테스트."""
-    seoul_tz = pytz.timezone("Asia/Seoul")
-    now = seoul_tz.localize(datetime(2026, 1, 4, 10, 0, 0))  # 10:00 (일반)
+    now = datetime(2026, 1, 4, 10, 0, 0, tzinfo=SEOUL_TZ)  # 10:00 (일반)
 
     mock_provider = MagicMock()
     mock_mysql_conn = MagicMock()
@@ -69,8 +61,7 @@ def test_budget_blocked() -> None:
 
 def test_executed() -> None:
     """실행 허용 테스트."""
-    seoul_tz = pytz.timezone("Asia/Seoul")
-    now = seoul_tz.localize(datetime(2026, 1, 4, 10, 0, 0))  # 10:00 (일반)
+    now = datetime(2026, 1, 4, 10, 0, 0, tzinfo=SEOUL_TZ)  # 10:00 (일반)
 
     mock_provider = MagicMock()
     mock_mysql_conn = MagicMock()
@@ -109,8 +100,7 @@ def test_executed() -> None:
 
 def test_executed_morning_rush_hour() -> None:
     """출근 시간대 실행 허용 테스트."""
-    seoul_tz = pytz.timezone("Asia/Seoul")
-    now = seoul_tz.localize(datetime(2026, 1, 4, 8, 0, 0))  # 08:00 (출근)
+    now = datetime(2026, 1, 4, 8, 0, 0, tzinfo=SEOUL_TZ)  # 08:00 (출근)
 
     mock_provider = MagicMock()
     mock_mysql_conn = MagicMock()
@@ -140,11 +130,10 @@ def test_executed_morning_rush_hour() -> None:
 
 def test_interval_not_elapsed_normal_time() -> None:
     """일반 시간대(15분)에서 1분 간격 실행 시 두 번째 실행이 SKIP 되는 테스트."""
-    seoul_tz = pytz.timezone("Asia/Seoul")
     # 첫 번째 실행: 10:00
-    first_run = seoul_tz.localize(datetime(2026, 1, 4, 10, 0, 0))
+    first_run = datetime(2026, 1, 4, 10, 0, 0, tzinfo=SEOUL_TZ)
     # 두 번째 실행: 10:01 (1분 후, 15분 간격 미충족)
-    second_run = seoul_tz.localize(datetime(2026, 1, 4, 10, 1, 0))
+    second_run = datetime(2026, 1, 4, 10, 1, 0, tzinfo=SEOUL_TZ)
 
     mock_provider = MagicMock()
     mock_mysql_conn = MagicMock()
@@ -179,11 +168,10 @@ def test_interval_not_elapsed_normal_time() -> None:
 
 def test_interval_not_elapsed_commute_time() -> None:
     """출퇴근 시간대(2분)에서 2분 미만 실행 시 SKIP 되는 테스트."""
-    seoul_tz = pytz.timezone("Asia/Seoul")
     # 첫 번째 실행: 08:00 (출근 시간대)
-    first_run = seoul_tz.localize(datetime(2026, 1, 4, 8, 0, 0))
+    first_run = datetime(2026, 1, 4, 8, 0, 0, tzinfo=SEOUL_TZ)
     # 두 번째 실행: 08:01 (1분 후, 2분 간격 미충족)
-    second_run = seoul_tz.localize(datetime(2026, 1, 4, 8, 1, 0))
+    second_run = datetime(2026, 1, 4, 8, 1, 0, tzinfo=SEOUL_TZ)
 
     mock_provider = MagicMock()
     mock_mysql_conn = MagicMock()
@@ -214,3 +202,65 @@ def test_interval_not_elapsed_commute_time() -> None:
 
         # Runner는 호출되지 않아야 함
         mock_runner.assert_not_called()
+
+
+def test_naive_last_snapshot_at_assumed_seoul() -> None:
+    """MySQL DATETIME(naive) 값은 Asia/Seoul 기준으로 해석되어야 함."""
+    now = datetime(2026, 1, 4, 10, 1, 0, tzinfo=SEOUL_TZ)
+    # DB에서 읽은 timezone-naive 값 (10:00 KST)
+    naive_last = datetime(2026, 1, 4, 10, 0, 0)
+
+    with patch(
+        "ingestion.orchestrator.get_last_snapshot_at", return_value=naive_last
+    ), patch("ingestion.orchestrator.run_snapshot_once") as mock_runner:
+        result = run_orchestrator_once(
+            now=now,
+            call_ranges=None,
+            provider=MagicMock(),
+            mysql_conn=MagicMock(),
+            clock=lambda: now,
+            used_calls_today=0,
+        )
+
+    assert result["reason"] == "interval_not_elapsed"
+    assert result["elapsed_seconds"] == 60.0
+    mock_runner.assert_not_called()
+
+
+def test_get_last_snapshot_at_uses_indexed_lookup() -> None:
+    """최근 snapshot 시각은 인덱스 기반 ORDER BY ... LIMIT 1로 조회해야 함."""
+    from ingestion.orchestrator import get_last_snapshot_at
+
+    last = datetime(2026, 1, 4, 10, 0, 0)
+    conn = FakeConn()
+    cursor = conn._cursor
+    cursor.fetchone_results.append((last,))
+
+    assert get_last_snapshot_at(conn) == last
+    sql = cursor.executed[-1][0]
+    assert "ORDER BY created_at DESC" in sql
+    assert "LIMIT 1" in sql
+    assert cursor.closed == 1
+
+    # 테이블이 비어 있으면 None
+    assert get_last_snapshot_at(conn) is None
+
+
+def test_precomputed_snapshot_id_passed_through() -> None:
+    """호출자가 넘긴 snapshot_id를 다시 만들지 않고 그대로 Runner에 전달해야 함."""
+    now = datetime(2026, 1, 4, 10, 0, 0, tzinfo=SEOUL_TZ)
+
+    with patch("ingestion.orchestrator.get_last_snapshot_at", return_value=None), patch(
+        "ingestion.orchestrator.run_snapshot_once", return_value={"status": "ok"}
+    ) as mock_runner:
+        result = run_orchestrator_once(
+            now=now,
+            provider=MagicMock(),
+            mysql_conn=MagicMock(),
+            clock=lambda: now,
+            used_calls_today=0,
+            snapshot_id="20260104_100000",
+        )
+
+    assert result["snapshot_id"] == "20260104_100000"
+    assert mock_runner.call_args.kwargs["snapshot_id"] == "20260104_100000"
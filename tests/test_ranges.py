@@ -0,0 +1,22 @@
+"""호출 범위 문자열 파싱 테스트."""
+
+import pytest
+
+from ingestion.util.ranges import parse_ranges
+
+
+def test_parse_ranges_basic() -> None:
+    """콤마/하이픈 구분 범위와 앞뒤 공백을 처리해야 함."""
+    assert parse_ranges("0-999, 1000-1999 ,2000 - 2999") == [
+        (0, 999),
+        (1000, 1999),
+        (2000, 2999),
+    ]
+
+
+def test_parse_ranges_invalid() -> None:
+    """하이픈이 없거나 숫자가 아니면 ValueError."""
+    with pytest.raises(ValueError):
+        parse_ranges("0-999,1000")
+    with pytest.raises(ValueError):
+        parse_ranges("a-b")
@@ -4,185 +4,151 @@
 구현 상세가 아니라 "정책 값"을 검증합니다.
 """
 
-import sys
 from datetime import datetime
-from pathlib import Path
 
-import pytz
+import pytest
 
-# 프로젝트 루트를 Python 경로에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from ingestion.scheduler import (  # noqa: E402
+from ingestion.scheduler import (
     COMMUTE_INTERVAL_SECONDS,
     NORMAL_INTERVAL_SECONDS,
     decide_collection,
 )
+from ingestion.tz import SEOUL_TZ
+
+
+def _seoul(hour: int, minute: int, second: int) -> datetime:
+    return datetime(2026, 1, 4, hour, minute, second, tzinfo=SEOUL_TZ)
+
+
+# (시각, time_bucket, interval_seconds) 정책표: 모듈 로드 시 1회 생성
+# 출근/퇴근 120초(2분), 일반 900초(15분), 경계 시각은 양 끝 포함
+_COLLECT_CASES = (
+    # 출근 시간대
+    (_seoul(7, 0, 0), "morning", 120),
+    (_seoul(8, 15, 0), "morning", 120),
+    (_seoul(9, 30, 0), "morning", 120),
+    # 퇴근 시간대
+    (_seoul(17, 30, 0), "evening", 120),
+    (_seoul(19, 0, 0), "evening", 120),
+    (_seoul(20, 0, 0), "evening", 120),
+    # 일반 시간대
+    (_seoul(6, 0, 0), "normal", 900),
+    (_seoul(10, 0, 0), "normal", 900),
+    (_seoul(23, 0, 0), "normal", 900),
+    (_seoul(0, 15, 0), "normal", 900),
+    # 경계 전환: 출근 종료, 퇴근 종료, 심야 시작 전, 심야 종료 후
+    (_seoul(9, 30, 1), "normal", 900),
+    (_seoul(20, 0, 1), "normal", 900),
+    (_seoul(0, 29, 59), "normal", 900),
+    (_seoul(5, 0, 1), "normal", 900),
+)
 
 
-def test_commute_time_interval_is_120_seconds() -> None:
-    """출근 시간대 수집 간격이 120초(2분)인지 검증."""
-    seoul_tz = pytz.timezone("Asia/Seoul")
-
-    # 07:00:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 7, 0, 0))
-    result = decide_collection(now=now)
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == COMMUTE_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 120
-    assert result["time_bucket"] == "morning"
-
-    # 08:15:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 8, 15, 0))
-    result = decide_collection(now=now)
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == COMMUTE_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 120
-    assert result["time_bucket"] == "morning"
-
-    # 09:30:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 9, 30, 0))
-    result = decide_collection(now=now)
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == COMMUTE_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 120
-    assert result["time_bucket"] == "morning"
-
-
-def test_evening_time_interval_is_120_seconds() -> None:
-    """퇴근 시간대 수집 간격이 120초(2분)인지 검증."""
-    seoul_tz = pytz.timezone("Asia/Seoul")
-
-    # 17:30:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 17, 30, 0))
-    result = decide_collection(now=now)
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == COMMUTE_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 120
-    assert result["time_bucket"] == "evening"
-
-    # 19:00:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 19, 0, 0))
-    result = decide_collection(now=now)
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == COMMUTE_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 120
-    assert result["time_bucket"] == "evening"
-
-    # 20:00:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 20, 0, 0))
-    result = decide_collection(now=now)
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == COMMUTE_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 120
-    assert result["time_bucket"] == "evening"
-
+def test_interval_constants() -> None:
+    """정책 상수 값 검증 (출근/퇴근 2분, 일반 15분)."""
+    assert COMMUTE_INTERVAL_SECONDS == 120
+    assert NORMAL_INTERVAL_SECONDS == 900
 
-def test_normal_time_interval_is_900_seconds() -> None:
-    """일반 시간대 수집 간격이 900초(15분)인지 검증."""
-    seoul_tz = pytz.timezone("Asia/Seoul")
 
-    # 06:00:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 6, 0, 0))
-    result = decide_collection(now=now)
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == NORMAL_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 900
-    assert result["time_bucket"] == "normal"
-
-    # 10:00:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 10, 0, 0))
+@pytest.mark.parametrize(
+    "now,bucket,interval",
+    _COLLECT_CASES,
+    ids=[case[0].strftime("%H:%M:%S") for case in _COLLECT_CASES],
+)
+def test_collect_time_buckets(now: datetime, bucket: str, interval: int) -> None:
+    """수집 시간대(출근/퇴근/일반)와 경계 전환의 판단 결과 검증."""
     result = decide_collection(now=now)
     assert result["should_collect"] is True
-    assert result["interval_seconds"] == NORMAL_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 900
-    assert result["time_bucket"] == "normal"
+    assert result["interval_seconds"] == interval
+    assert result["time_bucket"] == bucket
 
-    # 23:00:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 23, 0, 0))
-    result = decide_collection(now=now)
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == NORMAL_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 900
-    assert result["time_bucket"] == "normal"
 
-    # 00:15:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 0, 15, 0))
-    result = decide_collection(now=now)
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == NORMAL_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 900
-    assert result["time_bucket"] == "normal"
+# 심야 종료 후 첫 수집 가능 시각 05:00:01 (자정 기준 경과 초, 정책 값)
+_NIGHT_WAKEUP_S = 5 * 3600 + 1
 
+# (시각, 05:00:01까지 남은 초) 심야 정책표: 모듈 로드 시 1회 생성
+_NIGHT_CASES = (
+    (_seoul(0, 30, 0), _NIGHT_WAKEUP_S - 30 * 60),  # 심야 시작 경계
+    (_seoul(2, 0, 0), _NIGHT_WAKEUP_S - 2 * 3600),
+    (_seoul(5, 0, 0), 1),  # 심야 종료 경계
+)
 
-def test_night_time_should_not_collect() -> None:
-    """심야 시간대는 수집하지 않는지 검증."""
-    seoul_tz = pytz.timezone("Asia/Seoul")
 
-    # 00:30:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 0, 30, 0))
+@pytest.mark.parametrize(
+    "now,expected_seconds",
+    _NIGHT_CASES,
+    ids=[case[0].strftime("%H:%M:%S") for case in _NIGHT_CASES],
+)
+def test_night_time_should_not_collect(now: datetime, expected_seconds: int) -> None:
+    """심야 시간대는 수집하지 않고 05:00:01까지 남은 초를 반환하는지 검증."""
     result = decide_collection(now=now)
     assert result["should_collect"] is False
     assert result["interval_seconds"] > 0
     assert result["time_bucket"] == "night"
-    # 05:00:01까지의 초 계산 확인
-    expected_seconds = (5 * 3600 + 1) - (30 * 60)  # 05:00:01 - 00:30:00
     assert result["interval_seconds"] == expected_seconds
 
-    # 02:00:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 2, 0, 0))
-    result = decide_collection(now=now)
-    assert result["should_collect"] is False
-    assert result["interval_seconds"] > 0
-    assert result["time_bucket"] == "night"
-    # 05:00:01까지의 초 계산 확인
-    expected_seconds = (5 * 3600 + 1) - (2 * 3600)  # 05:00:01 - 02:00:00
-    assert result["interval_seconds"] == expected_seconds
 
-    # 05:00:00
-    now = seoul_tz.localize(datetime(2026, 1, 4, 5, 0, 0))
-    result = decide_collection(now=now)
-    assert result["should_collect"] is False
-    assert result["interval_seconds"] > 0
-    assert result["time_bucket"] == "night"
-    # 05:00:01까지의 초 계산 확인
-    expected_seconds = 1  # 05:00:01 - 05:00:00
-    assert result["interval_seconds"] == expected_seconds
+def test_collect_result_is_fresh_dict() -> None:
+    """호출자가 결과를 수정해도 다음 판단 결과에 영향이 없어야 함 (매 호출 새 dict)."""
+    result = decide_collection(now=_seoul(8, 0, 0))
+    assert type(result) is dict
 
+    result["interval_seconds"] = 0
+    result["reason"] = "modified"
+    assert decide_collection(now=_seoul(8, 5, 0)) == {
+        "should_collect": True,
+        "interval_seconds": COMMUTE_INTERVAL_SECONDS,
+        "time_bucket": "morning",
+    }
 
-def test_time_boundary_transitions() -> None:
-    """시간대 경계 전환 검증."""
-    seoul_tz = pytz.timezone("Asia/Seoul")
 
-    # 09:30:01 → 일반 (출근 시간대 종료)
-    now = seoul_tz.localize(datetime(2026, 1, 4, 9, 30, 1))
-    result = decide_collection(now=now)
-    assert result["time_bucket"] == "normal"
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == NORMAL_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 900
+def test_non_seoul_aware_input_converted_to_seoul() -> None:
+    """UTC 등 다른 timezone 입력도 공유 SEOUL_TZ 기준으로 판단해야 함."""
+    from datetime import timezone
 
-    # 20:00:01 → 일반 (퇴근 시간대 종료)
-    now = seoul_tz.localize(datetime(2026, 1, 4, 20, 0, 1))
-    result = decide_collection(now=now)
-    assert result["time_bucket"] == "normal"
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == NORMAL_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 900
+    # 2026-01-03 22:30 UTC == 2026-01-04 07:30 KST (출근 시간대)
+    result = decide_collection(now=datetime(2026, 1, 3, 22, 30, 0, tzinfo=timezone.utc))
+    assert result["time_bucket"] == "morning"
 
-    # 00:29:59 → 일반 (심야 시작 전)
-    now = seoul_tz.localize(datetime(2026, 1, 4, 0, 29, 59))
-    result = decide_collection(now=now)
-    assert result["time_bucket"] == "normal"
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == NORMAL_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 900
 
-    # 05:00:01 → 일반 (심야 종료 후)
-    now = seoul_tz.localize(datetime(2026, 1, 4, 5, 0, 1))
-    result = decide_collection(now=now)
-    assert result["time_bucket"] == "normal"
-    assert result["should_collect"] is True
-    assert result["interval_seconds"] == NORMAL_INTERVAL_SECONDS
-    assert result["interval_seconds"] == 900
+def test_bucket_table_matches_reference_policy() -> None:
+    """bisect 경계 테이블이 시간대 정의(양 끝 포함)와 하루 전체에서 일치해야 함."""
+    from datetime import timedelta
+
+    from ingestion.scheduler import (
+        EVENING_END,
+        EVENING_START,
+        MORNING_END,
+        MORNING_START,
+        NIGHT_END,
+        NIGHT_START,
+    )
+
+    def reference_bucket(seconds: int) -> str:
+        if MORNING_START <= seconds <= MORNING_END:
+            return "morning"
+        if EVENING_START <= seconds <= EVENING_END:
+            return "evening"
+        if NIGHT_START <= seconds <= NIGHT_END:
+            return "night"
+        return "normal"
+
+    midnight = datetime(2026, 1, 4, tzinfo=SEOUL_TZ)
+    # 모든 경계 ±1초와 하루 전체(7초 간격)를 확인
+    boundaries = (NIGHT_START, NIGHT_END, MORNING_START, MORNING_END, EVENING_START, EVENING_END)
+    seconds_to_check = set(range(0, 86400, 7))
+    for b in boundaries:
+        seconds_to_check.update((b - 1, b, b + 1))
+
+    for seconds in sorted(seconds_to_check):
+        now = midnight + timedelta(seconds=seconds)
+        result = decide_collection(now=now)
+        assert result["time_bucket"] == reference_bucket(seconds), now
+        if result["time_bucket"] == "night":
+            assert result["interval_seconds"] == NIGHT_END + 1 - seconds
+
+
+def test_night_interval_truncates_sub_second() -> None:
+    """microsecond가 있는 시각은 남은 초를 내림(int 절사)해야 함."""
+    now = datetime(2026, 1, 4, 4, 59, 59, 500000, tzinfo=SEOUL_TZ)
+    assert decide_collection(now=now)["interval_seconds"] == 1
@@ -0,0 +1,10 @@
+"""SQL 문자열 조립 유틸 테스트."""
+
+from ingestion.util.sql import values_clause
+
+
+def test_values_clause_shape() -> None:
+    """placeholder를 콤마로 이어 붙이고, 같은 입력은 같은 객체를 재사용해야 함."""
+    assert values_clause("(%s, %s)", 1) == "(%s, %s)"
+    assert values_clause("(%s, %s)", 3) == "(%s, %s), (%s, %s), (%s, %s)"
+    assert values_clause("(%s, %s)", 3) is values_clause("(%s, %s)", 3)
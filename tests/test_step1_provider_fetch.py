@@ -0,0 +1,113 @@
+"""STEP 1 테스트: Provider 페이지 호출 검증 (네트워크 없이)."""
+
+import time
+
+import pytest
+
+from ingestion.providers.seoul_subway import SeoulSubwayArrivalProvider
+
+
+def _fake_page(start: int, end: int) -> dict:
+    return {
+        "result_code": "INFO-000",
+        "result_message": "OK",
+        "total_count": 2500,
+        "rows": [{"rowNum": str(start)}],
+    }
+
+
+def test_fetch_pages_preserves_range_order(monkeypatch) -> None:
+    """동시 호출이어도 결과는 ranges 순서를 유지해야 함."""
+    provider = SeoulSubwayArrivalProvider(api_key="test")
+
+    def slow_first_page(start: int, end: int) -> dict:
+        # 첫 페이지가 가장 늦게 끝나도 순서가 유지되는지 확인
+        if start == 0:
+            time.sleep(0.05)
+        return _fake_page(start, end)
+
+    monkeypatch.setattr(provider, "fetch_page", slow_first_page)
+
+    ranges = [(0, 999), (1000, 1999), (2000, 2999)]
+    results = provider.fetch_pages(ranges)
+
+    assert [r["rows"][0]["rowNum"] for r in results] == ["0", "1000", "2000"]
+
+
+def test_fetch_pages_empty_ranges() -> None:
+    """빈 ranges는 호출 없이 빈 리스트를 반환해야 함."""
+    provider = SeoulSubwayArrivalProvider(api_key="test")
+    assert provider.fetch_pages([]) == []
+
+
+def test_fetch_fixed_pages_assembles_results(monkeypatch) -> None:
+    """fetch_fixed_pages가 페이지 결과를 순서대로 조립하는지 검증."""
+    provider = SeoulSubwayArrivalProvider(api_key="test")
+    monkeypatch.setattr(provider, "fetch_page", _fake_page)
+
+    result = provider.fetch_fixed_pages()
+
+    assert [(p.start, p.end) for p in result.pages] == provider.DEFAULT_CALL_RANGES
+    assert [row["rowNum"] for row in result.all_rows] == ["0", "1000", "2000"]
+    assert result.first_row_keys == {"rowNum"}
+
+
+def test_fetch_pages_propagates_error(monkeypatch) -> None:
+    """한 페이지라도 실패하면 RuntimeError가 전파되어야 함."""
+    provider = SeoulSubwayArrivalProvider(api_key="test")
+
+    def failing_page(start: int, end: int) -> dict:
+        if start == 1000:
+            raise RuntimeError("HTTP 요청 실패")
+        return _fake_page(start, end)
+
+    monkeypatch.setattr(provider, "fetch_page", failing_page)
+
+    with pytest.raises(RuntimeError):
+        provider.fetch_pages([(0, 999), (1000, 1999)])
+
+
+def test_fetch_page_reuses_session(monkeypatch) -> None:
+    """fetch_page가 모듈 requests.get이 아닌 provider 세션을 사용하는지 검증."""
+    provider = SeoulSubwayArrivalProvider(api_key="test")
+    xml_text = (
+        "<realtimeStationArrival><RESULT><CODE>INFO-000</CODE>"
+        "<MESSAGE>OK</MESSAGE></RESULT><totalCount>1</totalCount>"
+        "<row><rowNum>1</rowNum></row></realtimeStationArrival>"
+    )
+    calls = []
+
+    class _Response:
+        status_code = 200
+        text = xml_text
+
+    def fake_get(url, timeout):
+        calls.append(url)
+        return _Response()
+
+    monkeypatch.setattr(provider._session, "get", fake_get)
+
+    provider.fetch_page(0, 999)
+    provider.fetch_page(1000, 1999)
+
+    assert len(calls) == 2
+    provider.close()
+
+
+def test_build_url_shape() -> None:
+    """미리 조립한 URL 앞/뒤 부분으로 기존과 같은 URL을 만드는지 검증."""
+    provider = SeoulSubwayArrivalProvider(api_key="KEY", base_url="http://host/api")
+    assert (
+        provider._build_url(0, 999)
+        == "http://host/api/KEY/xml/realtimeStationArrival/0/999/"
+    )
+
+
+def test_session_pool_covers_max_concurrent_pages() -> None:
+    """동시 호출되는 최대 페이지 수(4)만큼 세션 커넥션 풀이 확보되어야 함."""
+    from ingestion.runner.snapshot_runner import _RANGES_4
+
+    provider = SeoulSubwayArrivalProvider(api_key="test")
+    adapter = provider._session.get_adapter("http://openapi.seoul.go.kr:8088/")
+    assert adapter._pool_maxsize >= len(_RANGES_4)
+    provider.close()
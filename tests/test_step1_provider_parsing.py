@@ -1,13 +1,6 @@
 """STEP 1 테스트: XML 파싱 무손실 검증 (네트워크 없이)."""
 
-import sys
-from pathlib import Path
-
-# 프로젝트 루트를 Python 경로에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from ingestion.providers.seoul_subway import parse_xml  # noqa: E402
+from ingestion.providers.seoul_subway import parse_xml
 
 # 서울 지하철 API XML 샘플 (0~5 범위 조회 예시)
 XML_SAMPLE = """<?xml version="1.0" encoding="UTF-8"?>
@@ -141,14 +134,14 @@ def test_parse_xml_all_rows_have_same_keys() -> None:
     _, _, _, rows = parse_xml(XML_SAMPLE)
     assert len(rows) > 0, "rows가 비어있습니다"
 
-    baseline_keys = set(rows[0].keys())
+    baseline_keys = frozenset(rows[0])
 
+    # dict keys view는 set과 직접 비교되므로 row마다 set을 만들지 않음
     for idx, row in enumerate(rows):
-        row_keys = set(row.keys())
-        assert row_keys == baseline_keys, (
+        assert row.keys() == baseline_keys, (
             f"row[{idx}]의 키가 baseline과 다릅니다. "
             f"baseline: {sorted(baseline_keys)}, "
-            f"row[{idx}]: {sorted(row_keys)}"
+            f"row[{idx}]: {sorted(row)}"
         )
 
 
@@ -162,3 +155,118 @@ def test_parse_xml_all_values_are_strings() -> None:
                 f"row[{idx}].{key}의 타입이 str이 아닙니다: {type(value)}"
             )
 
+
+def test_parse_xml_row_total_count_fallback() -> None:
+    """루트 totalCount가 없으면 첫 row 내부 totalCount를 사용하는지 검증."""
+    xml_text = """<realtimeStationArrival>
+    <RESULT><code>INFO-000</code><message>OK</message></RESULT>
+    <row><totalCount>3500</totalCount><rowNum>0</rowNum></row>
+    <row><totalCount>3500</totalCount><rowNum>1</rowNum></row>
+</realtimeStationArrival>"""
+    result_code, _, total_count, rows = parse_xml(xml_text)
+    assert result_code == "INFO-000"
+    assert total_count == 3500
+    assert [row["rowNum"] for row in rows] == ["0", "1"]
+
+
+def test_parse_xml_invalid_xml_raises() -> None:
+    """잘못된 XML은 RuntimeError로 변환되어야 함."""
+    try:
+        parse_xml("<realtimeStationArrival><RESULT></realtimeStationArrival>")
+    except RuntimeError as e:
+        assert "XML 파싱 실패" in str(e)
+    else:
+        raise AssertionError("RuntimeError가 발생하지 않았습니다")
+
+
+def test_parse_xml_nested_and_duplicate_tags() -> None:
+    """중첩 태그는 prefix로, 중복 태그는 번호 suffix로 보존되는지 검증."""
+    xml_text = """<realtimeStationArrival>
+    <RESULT><CODE>INFO-000</CODE></RESULT>
+    <row>
+        <a>1</a>
+        <a>2</a>
+        <n><a>3</a><b>4</b></n>
+        <a>5</a>
+        <n_a>6</n_a>
+    </row>
+</realtimeStationArrival>"""
+    _, _, _, rows = parse_xml(xml_text)
+    assert list(rows[0].items()) == [
+        ("a", "1"),
+        ("a__1", "2"),
+        ("n_a", "3"),
+        ("n_b", "4"),
+        ("a__2", "5"),
+        ("n_a__1", "6"),
+    ]
+
+
+def test_parse_xml_skip_rows() -> None:
+    """parse_rows=False면 rows 없이 totalCount만 반환해야 함."""
+    result_code, _, total_count, rows = parse_xml(XML_SAMPLE, parse_rows=False)
+    assert result_code == "INFO-000"
+    assert total_count == 19
+    assert rows == []
+
+
+def test_parse_xml_elementtree_fallback_matches(monkeypatch) -> None:
+    """lxml 유무와 관계없이 파싱 결과가 동일해야 함."""
+    import ingestion.providers.seoul_subway as seoul_subway
+
+    expected = parse_xml(XML_SAMPLE)
+    monkeypatch.setattr(seoul_subway, "_lxml_etree", None)
+    assert parse_xml(XML_SAMPLE) == expected
+
+
+def test_parse_xml_small_feed_chunks_match(monkeypatch) -> None:
+    """태그/한글이 chunk 경계에서 잘려도 두 backend 모두 결과가 동일해야 함."""
+    import ingestion.providers.seoul_subway as seoul_subway
+
+    expected = parse_xml(XML_SAMPLE)
+    monkeypatch.setattr(seoul_subway, "_FEED_CHUNK_CHARS", 7)
+    assert parse_xml(XML_SAMPLE) == expected
+    monkeypatch.setattr(seoul_subway, "_lxml_etree", None)
+    assert parse_xml(XML_SAMPLE) == expected
+
+
+def test_iter_top_level_yields_rows_before_document_end(monkeypatch) -> None:
+    """row는 문서 전체를 feed하기 전에 yield되어야 함 (트리 전체를 먼저 만들지 않음)."""
+    import ingestion.providers.seoul_subway as seoul_subway
+
+    monkeypatch.setattr(seoul_subway, "_FEED_CHUNK_CHARS", 64)
+    parser = seoul_subway._new_pull_parser()
+    fed: list[str] = []
+    real_feed = parser.feed
+
+    class _SpyParser:
+        def feed(self, data: str) -> None:
+            fed.append(data)
+            real_feed(data)
+
+        def __getattr__(self, name: str):
+            return getattr(parser, name)
+
+    for elem in seoul_subway._iter_top_level(_SpyParser(), XML_SAMPLE):
+        if elem.tag == "row":
+            assert len("".join(fed)) < len(XML_SAMPLE)
+            break
+    else:
+        raise AssertionError("row가 yield되지 않았습니다")
+
+
+def test_pull_parser_prefers_lxml() -> None:
+    """requirements의 lxml이 설치되어 있으므로 libxml2 기반 pull parser를 사용해야 함."""
+    from lxml import etree as lxml_etree
+
+    from ingestion.providers.seoul_subway import _new_pull_parser
+
+    assert isinstance(_new_pull_parser(), lxml_etree.XMLPullParser)
+
+
+def test_parse_xml_row_keys_are_shared() -> None:
+    """모든 row dict가 같은(intern된) key 문자열 객체를 공유해야 함."""
+    _, _, _, rows = parse_xml(XML_SAMPLE)
+    first_keys = list(rows[0])
+    for row in rows[1:]:
+        assert all(a is b for a, b in zip(first_keys, row))
@@ -1,13 +1,8 @@
 """STEP 3 테스트: payload_hash 계산 검증."""
 
-import sys
-from pathlib import Path
+import pytest
 
-# 프로젝트 루트를 Python 경로에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-from ingestion.pipeline.raw_ingest import compute_payload_hash  # noqa: E402
+from ingestion.pipeline.raw_ingest import compute_payload_hash
 
 
 def test_payload_hash_same_for_different_key_order() -> None:
@@ -85,3 +80,65 @@ def test_payload_hash_empty_dict() -> None:
     assert len(hash_value) == 64
     assert isinstance(hash_value, str)
 
+
+def test_payload_hash_matches_legacy_canonical_json() -> None:
+    """기존 적재 row와 중복 판정이 유지되도록 canonical JSON 해시가 동일해야 함."""
+    import hashlib
+    import json
+
+    payload = {
+        "subwayId": "1001",
+        "statnNm": "서울역",
+        "arvlMsg2": "전역 \"도착\"\t\\",
+        "rowNum": "1",
+    }
+    legacy_json = json.dumps(
+        dict(sorted(payload.items())), ensure_ascii=False, separators=(",", ":")
+    )
+    legacy_hash = hashlib.sha256(legacy_json.encode("utf-8")).hexdigest()
+
+    assert compute_payload_hash(payload) == legacy_hash
+
+
+def test_serialize_payload_reuses_canonical_bytes() -> None:
+    """serialize_payload가 해시 대상 bytes를 그대로 반환하는지 검증."""
+    import hashlib
+
+    from ingestion.pipeline.raw_ingest import serialize_payload
+
+    json_bytes, payload_hash = serialize_payload({"b": "2", "a": "1"})
+
+    assert json_bytes == b'{"a":"1","b":"2"}'
+    # DB에는 BINARY(32) raw digest로 저장
+    assert payload_hash == hashlib.sha256(json_bytes).digest()
+    assert len(payload_hash) == 32
+    assert payload_hash.hex() == compute_payload_hash({"b": "2", "a": "1"})
+
+
+def test_payload_hash_golden_value() -> None:
+    """uq_payload_hash 중복 판정 기준값: 해시 규칙(직렬화 형식 포함)이 바뀌면 실패해야 함."""
+    payload = {"subwayId": "1001", "statnNm": "서울역", "rowNum": "1"}
+
+    assert compute_payload_hash(payload) == (
+        "bcd5ccf8dac1b047a7e21afce58b8c3ac794ca176be67e2cf7b0fac61de67213"
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["\x01\x1f\x7f", "\r\n", "\u2028\u2029", "/", "<&>", "\U0001F600", ""],
+)
+def test_serialize_payload_escaping_matches_stdlib_json(value: str) -> None:
+    """제어문자/비BMP 등 escape 경계에서도 orjson 출력이 stdlib json과 byte 단위로 같아야 함."""
+    import json
+
+    from ingestion.pipeline.raw_ingest import serialize_payload
+
+    payload = {"rowNum": "1", "arvlMsg2": value}
+    legacy_json = json.dumps(
+        dict(sorted(payload.items())), ensure_ascii=False, separators=(",", ":")
+    )
+
+    json_bytes, _ = serialize_payload(payload)
+
+    assert json_bytes == legacy_json.encode("utf-8")
@@ -0,0 +1,112 @@
+"""STEP 3 테스트: Raw 적재 SQL 구성 검증 (DB 없이)."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from ingestion.pipeline.raw_ingest import ingest_rows_page
+from ingestion.tz import SEOUL_TZ
+
+
+def _collected_at() -> datetime:
+    return datetime(2026, 1, 4, 10, 0, 0, tzinfo=SEOUL_TZ)
+
+
+def test_ingest_rows_page_single_multi_row_insert() -> None:
+    """한 페이지의 rows가 multi-row VALUES INSERT 1회로 전송되는지 검증."""
+    mock_mysql_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_mysql_conn.cursor.return_value = mock_cursor
+    mock_cursor.rowcount = 2
+
+    rows = [{"rowNum": "1"}, {"rowNum": "2"}, {"rowNum": "3"}]
+    result = ingest_rows_page(
+        mysql_conn=mock_mysql_conn,
+        snapshot_id="20260104_100000",
+        collected_at=_collected_at(),
+        page_start=0,
+        page_end=999,
+        rows=rows,
+    )
+
+    mock_cursor.execute.assert_called_once()
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "INSERT INTO subway_arrival_raw" in sql
+    # 중복 키만 건너뛰고 그 외 데이터 오류는 예외로 드러나야 하므로 IGNORE 금지
+    assert "IGNORE" not in sql
+    assert sql.rstrip().endswith("ON DUPLICATE KEY UPDATE id = id")
+    assert sql.count("(%s, %s, %s, %s, %s, %s)") == 3
+    assert len(params) == 3 * 6
+    assert params[1] == "2026-01-04 10:00:00"  # collected_at (페이지당 1회 변환)
+    assert params[4] == '{"rowNum":"1"}'  # raw_payload
+
+    assert result == {
+        "attempted_rows": 3,
+        "inserted_rows": 2,
+        "skipped_duplicates": 1,
+    }
+    # commit/rollback은 Runner 책임
+    mock_mysql_conn.commit.assert_not_called()
+
+
+def test_ingest_rows_page_chunks_large_pages() -> None:
+    """chunk 크기를 넘는 rows는 여러 INSERT로 나뉘는지 검증."""
+    mock_mysql_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_mysql_conn.cursor.return_value = mock_cursor
+    mock_cursor.rowcount = 2
+
+    rows = [{"rowNum": str(i)} for i in range(5)]
+    with patch("ingestion.pipeline.raw_ingest.RAW_INSERT_CHUNK_SIZE", 2):
+        result = ingest_rows_page(
+            mysql_conn=mock_mysql_conn,
+            snapshot_id="20260104_100000",
+            collected_at=_collected_at(),
+            page_start=0,
+            page_end=999,
+            rows=rows,
+        )
+
+    assert mock_cursor.execute.call_count == 3  # 2 + 2 + 1
+    assert result["attempted_rows"] == 5
+    assert result["inserted_rows"] == 6  # rowcount mock 합계
+
+
+def test_ingest_rows_page_empty_rows() -> None:
+    """빈 rows는 DB에 접근하지 않아야 함."""
+    mock_mysql_conn = MagicMock()
+
+    result = ingest_rows_page(
+        mysql_conn=mock_mysql_conn,
+        snapshot_id="20260104_100000",
+        collected_at=_collected_at(),
+        page_start=0,
+        page_end=999,
+        rows=[],
+    )
+
+    mock_mysql_conn.cursor.assert_not_called()
+    assert result["attempted_rows"] == 0
+
+
+def test_ingest_rows_page_full_page_single_statement() -> None:
+    """API 최대 페이지(1000 row)는 INSERT 1회로 전송되어야 함 (row당 왕복 없음)."""
+    mock_mysql_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_mysql_conn.cursor.return_value = mock_cursor
+    mock_cursor.rowcount = 1000
+
+    rows = [{"rowNum": str(i)} for i in range(1000)]
+    ingest_rows_page(
+        mysql_conn=mock_mysql_conn,
+        snapshot_id="20260104_100000",
+        collected_at=_collected_at(),
+        page_start=0,
+        page_end=999,
+        rows=rows,
+    )
+
+    mock_cursor.execute.assert_called_once()
+    mock_cursor.executemany.assert_not_called()
+    sql, params = mock_cursor.execute.call_args[0]
+    assert sql.count("(%s, %s, %s, %s, %s, %s)") == 1000
+    assert len(params) == 1000 * 6
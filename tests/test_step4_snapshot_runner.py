@@ -1,38 +1,111 @@
 """STEP 4 테스트: Snapshot Runner 부분 보존 로직 검증 (DI 기반)."""
 
-import sys
 from datetime import datetime
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Any, Callable
+from unittest.mock import patch
 
-import pytz
+from ingestion.runner.snapshot_runner import run_snapshot_once
+from ingestion.tz import SEOUL_TZ
+from tests._fakes import FakeConn, FakeCursor
 
-# 프로젝트 루트를 Python 경로에 추가
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
-from ingestion.runner.snapshot_runner import run_snapshot_once  # noqa: E402
+# 고정 시각 clock (모듈 로드 시 1회 생성, 테스트 간 결정적)
+_NOW = datetime(2026, 1, 4, 12, 0, 0, tzinfo=SEOUL_TZ)
+
+
+def _clock() -> datetime:
+    return _NOW
+
+
+class _CommitOrderConn(FakeConn):
+    """commit/rollback 시점의 실행 SQL 개수를 기록하고, 선택적으로 commit을 실패시키는 연결."""
+
+    def __init__(self, cursor: FakeCursor | None = None, commit_error: Exception | None = None):
+        super().__init__(cursor)
+        self.commit_error = commit_error
+        self.commit_at: int | None = None
+        self.rollback_at: int | None = None
+
+    def commit(self) -> None:
+        super().commit()
+        self.commit_at = len(self._cursor.executed)
+        if self.commit_error is not None:
+            raise self.commit_error
+
+    def rollback(self) -> None:
+        super().rollback()
+        self.rollback_at = len(self._cursor.executed)
+
+
+class _SavepointRollbackFailCursor(FakeCursor):
+    """ROLLBACK TO SAVEPOINT 실행 시 예외를 던지는 커서."""
+
+    def execute(self, sql: str, params: Any = None) -> None:
+        super().execute(sql, params)
+        if sql.startswith("ROLLBACK TO SAVEPOINT"):
+            raise Exception("SAVEPOINT does not exist")
+
+
+def _ok_page(rows: list[dict] | None = None, total_count: int | None = None) -> dict:
+    """정상 응답 page_data (rows 기본값은 빈 리스트)."""
+    return {
+        "result_code": "INFO-000",
+        "result_message": "OK",
+        "total_count": total_count,
+        "rows": rows if rows is not None else [],
+    }
+
+
+class _StubProvider:
+    """start별 응답(dict 또는 예외)을 돌려주는 Provider (MagicMock 대체)."""
+
+    def __init__(
+        self,
+        responses: dict[int, Any],
+        on_fetch: Callable[[int], None] | None = None,
+    ):
+        self._responses = responses
+        # 응답 전에 호출되는 hook (동시성 테스트의 barrier/event 대기용)
+        self._on_fetch = on_fetch
+
+    def fetch_page(self, start: int, end: int) -> dict:
+        if self._on_fetch is not None:
+            self._on_fetch(start)
+        response = self._responses[start]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _call_log_rows(cursor: FakeCursor) -> list[tuple]:
+    """Call Log multi-row INSERT의 flat params를 row 튜플 리스트로 복원."""
+    call_log_calls = [
+        (sql, params) for sql, params in cursor.executed
+        if "subway_api_call_log" in sql
+    ]
+    assert len(call_log_calls) == 1  # snapshot당 INSERT 1회
+    params = call_log_calls[0][1]
+    return [tuple(params[i : i + 6]) for i in range(0, len(params), 6)]
+
+
+def _savepoint_sql(cursor: FakeCursor) -> list[str]:
+    """cursor.execute로 실행된 SAVEPOINT 관련 SQL 목록."""
+    return [sql for sql, _ in cursor.executed if "SAVEPOINT" in sql]
 
 
 def test_snapshot_runner_partial_success() -> None:
     """부분 성공 시나리오 검증."""
-    # Mock 설정
-    mock_provider = MagicMock()
-    mock_mysql_conn = MagicMock()
-    mock_cursor = MagicMock()
-
     # 첫 번째 page: 성공 (2개 row)
     # 두 번째 page: 예외 발생
     # 세 번째 page: 성공 (1개 row)
-    mock_provider.fetch_page.side_effect = [
-        {"result_code": "INFO-000", "result_message": "OK", "total_count": None, "rows": [{"rowNum": "1"}, {"rowNum": "2"}]},  # page 1
-        Exception("Network error"),  # page 2 실패
-        {"result_code": "INFO-000", "result_message": "OK", "total_count": None, "rows": [{"rowNum": "3"}]},  # page 3
-    ]
-
-    mock_mysql_conn.cursor.return_value = mock_cursor
-    mock_cursor.executemany.return_value = None
-    mock_cursor.rowcount = 2  # 첫 번째와 세 번째 페이지에서 각각 2개, 1개 삽입
+    # 페이지는 동시에 호출되므로 호출 순서가 아닌 start 기준으로 응답 결정
+    provider = _StubProvider({
+        0: {"result_code": "INFO-000", "result_message": "OK", "total_count": None, "rows": [{"rowNum": "1"}, {"rowNum": "2"}]},  # page 1
+        1000: Exception("Network error"),  # page 2 실패
+        2000: {"result_code": "INFO-000", "result_message": "OK", "total_count": None, "rows": [{"rowNum": "3"}]},  # page 3
+    })
+    conn = FakeConn()
+    cursor = conn._cursor
 
     # ingest_rows_page mock
     def mock_ingest_rows_page(*, mysql_conn, snapshot_id, collected_at, page_start, page_end, rows):
@@ -42,10 +115,6 @@ def test_snapshot_runner_partial_success() -> None:
             return {"attempted_rows": 1, "inserted_rows": 1, "skipped_duplicates": 0}
         return {"attempted_rows": 0, "inserted_rows": 0, "skipped_duplicates": 0}
 
-    # clock mock
-    def mock_clock() -> datetime:
-        return datetime.now(pytz.timezone("Asia/Seoul"))
-
     with patch("ingestion.runner.snapshot_runner.ingest_rows_page") as mock_ingest:
         # ingest_rows_page mock 설정
         mock_ingest.side_effect = mock_ingest_rows_page
@@ -54,9 +123,9 @@ def test_snapshot_runner_partial_success() -> None:
         result = run_snapshot_once(
             snapshot_id="20260104_120000",
             call_ranges=[(0, 999), (1000, 1999), (2000, 2999)],
-            provider=mock_provider,
-            mysql_conn=mock_mysql_conn,
-            clock=mock_clock,
+            provider=provider,
+            mysql_conn=conn,
+            clock=_clock,
         )
 
         # 검증
@@ -82,45 +151,56 @@ def test_snapshot_runner_partial_success() -> None:
         assert result["inserted_total"] == 3  # 2 + 0 + 1
         assert result["errors_total"] == 1
 
-        # commit 호출 확인 (성공한 페이지만)
-        assert mock_mysql_conn.commit.call_count == 2  # 페이지 1, 3
-        # rollback 호출 확인 (실패한 페이지)
-        assert mock_mysql_conn.rollback.call_count == 1  # 페이지 2
+        # snapshot 전체 1회 commit
+        assert conn.commits == 1
+        # 페이지 2는 호출 단계에서 실패하여 되돌릴 INSERT가 없음
+        assert conn.rollbacks == 0
+        executed_sql = _savepoint_sql(cursor)
+        assert executed_sql == [
+            "SAVEPOINT page_0",
+            "SAVEPOINT page_2000",
+        ]
+
+        # Call Log는 snapshot당 multi-row INSERT 1회로 기록 (실패 페이지 포함)
+        call_log_params = _call_log_rows(cursor)
+        assert [(p[2], p[3], p[5]) for p in call_log_params] == [
+            (0, 999, "success"),
+            (1000, 1999, "error"),
+            (2000, 2999, "success"),
+        ]
 
         # snapshot_id가 반환 dict에 그대로 포함
         assert result["snapshot_id"] == "20260104_120000"
 
+        # snapshot 전체를 명시적 트랜잭션으로 시작 (FakeConn에는 autocommit 메서드 없음)
+        assert conn.begins == 1
+
 
 def test_snapshot_runner_all_success() -> None:
     """전체 성공 시나리오 검증."""
-    mock_provider = MagicMock()
-    mock_mysql_conn = MagicMock()
-    mock_cursor = MagicMock()
-
-    mock_provider.fetch_page.side_effect = [
-        {"result_code": "INFO-000", "result_message": "OK", "total_count": None, "rows": [{"rowNum": "1"}]},
-        {"result_code": "INFO-000", "result_message": "OK", "total_count": None, "rows": [{"rowNum": "2"}]},
-    ]
-
-    mock_mysql_conn.cursor.return_value = mock_cursor
-    mock_cursor.rowcount = 1
+    provider = _StubProvider({
+        start: {
+            "result_code": "INFO-000",
+            "result_message": "OK",
+            "total_count": None,
+            "rows": [{"rowNum": str(start)}],
+        }
+        for start in (0, 1000)
+    })
+    conn = FakeConn()
 
     def mock_ingest_rows_page(*, mysql_conn, snapshot_id, collected_at, page_start, page_end, rows):
         return {"attempted_rows": 1, "inserted_rows": 1, "skipped_duplicates": 0}
 
-    # clock mock
-    def mock_clock() -> datetime:
-        return datetime.now(pytz.timezone("Asia/Seoul"))
-
     with patch("ingestion.runner.snapshot_runner.ingest_rows_page") as mock_ingest:
         mock_ingest.side_effect = mock_ingest_rows_page
 
         result = run_snapshot_once(
             snapshot_id="20260104_120000",
             call_ranges=[(0, 999), (1000, 1999)],
-            provider=mock_provider,
-            mysql_conn=mock_mysql_conn,
-            clock=mock_clock,
+            provider=provider,
+            mysql_conn=conn,
+            clock=_clock,
         )
 
         assert result["status"] == "ok"
@@ -128,4 +208,352 @@ def test_snapshot_runner_all_success() -> None:
         assert result["attempted_total"] == 2
         assert result["inserted_total"] == 2
         assert result["snapshot_id"] == "20260104_120000"
-        assert mock_mysql_conn.commit.call_count == 2  # 두 페이지 모두 성공
+        assert conn.commits == 1  # snapshot 전체 1회
+        # 페이지별 commit 대신 SAVEPOINT만 두고, 성공 시 RELEASE 왕복도 하지 않음
+        assert _savepoint_sql(conn._cursor) == [
+            "SAVEPOINT page_0",
+            "SAVEPOINT page_1000",
+        ]
+
+
+def test_snapshot_runner_fetches_remaining_pages_concurrently() -> None:
+    """나머지 페이지 호출이 순차가 아닌 동시에 진행되는지 검증."""
+    import threading
+
+    ranges = [(1000, 1999), (2000, 2999), (3000, 3999)]
+    # 모든 페이지 호출이 동시에 진입해야만 통과하는 barrier (순차 호출이면 timeout)
+    barrier = threading.Barrier(len(ranges), timeout=5)
+    provider = _StubProvider(
+        {start: _ok_page() for start, _ in ranges},
+        on_fetch=lambda start: barrier.wait(),
+    )
+
+    with patch("ingestion.runner.snapshot_runner.ingest_rows_page") as mock_ingest:
+        mock_ingest.return_value = {"attempted_rows": 0, "inserted_rows": 0, "skipped_duplicates": 0}
+
+        result = run_snapshot_once(
+            snapshot_id="20260104_120000",
+            call_ranges=ranges,
+            provider=provider,
+            mysql_conn=FakeConn(),
+            clock=_clock,
+        )
+
+    assert result["status"] == "ok"
+    # 적재는 ranges 순서대로 수행
+    assert [c.kwargs["page_start"] for c in mock_ingest.call_args_list] == [1000, 2000, 3000]
+
+
+def test_snapshot_runner_ingests_while_later_pages_in_flight() -> None:
+    """앞 페이지 적재가 뒤 페이지 HTTP 호출 완료를 기다리지 않는지 검증."""
+    import threading
+
+    first_page_ingested = threading.Event()
+    waited = []
+
+    def wait_for_first_page(start: int) -> None:
+        if start == 2000:
+            # 모든 호출이 끝난 뒤에야 적재하면 timeout으로 False가 기록됨
+            waited.append(first_page_ingested.wait(timeout=5))
+
+    def mock_ingest(**kwargs):
+        if kwargs["page_start"] == 1000:
+            first_page_ingested.set()
+        return {"attempted_rows": 0, "inserted_rows": 0, "skipped_duplicates": 0}
+
+    provider = _StubProvider(
+        {1000: _ok_page(), 2000: _ok_page()},
+        on_fetch=wait_for_first_page,
+    )
+
+    with patch("ingestion.runner.snapshot_runner.ingest_rows_page", side_effect=mock_ingest):
+        result = run_snapshot_once(
+            snapshot_id="20260104_120000",
+            call_ranges=[(1000, 1999), (2000, 2999)],
+            provider=provider,
+            mysql_conn=FakeConn(),
+            clock=_clock,
+        )
+
+    assert result["status"] == "ok"
+    assert waited == [True]
+
+
+def test_snapshot_runner_called_at_recorded_in_fetch_worker() -> None:
+    """동시 호출 페이지의 called_at은 적재 순서가 아니라 worker의 호출 시각이어야 함."""
+    import threading
+    from datetime import timedelta
+
+    main_thread = threading.main_thread()
+    worker_now = _NOW + timedelta(seconds=1)
+
+    def thread_clock() -> datetime:
+        # runner 스레드에서 읽으면 _NOW, fetch worker에서 읽으면 worker_now
+        return _NOW if threading.current_thread() is main_thread else worker_now
+
+    provider = _StubProvider({
+        1000: {"result_code": "INFO-000", "result_message": "OK", "total_count": None, "rows": []},
+        2000: Exception("Network error"),
+    })
+    mysql_conn = FakeConn()
+
+    with patch("ingestion.runner.snapshot_runner.ingest_rows_page") as mock_ingest:
+        mock_ingest.return_value = {"attempted_rows": 0, "inserted_rows": 0, "skipped_duplicates": 0}
+        run_snapshot_once(
+            snapshot_id="20260104_120000",
+            call_ranges=[(1000, 1999), (2000, 2999)],
+            provider=provider,
+            mysql_conn=mysql_conn,
+            clock=thread_clock,
+        )
+
+    call_log_params = _call_log_rows(mysql_conn._cursor)
+    assert [(p[2], p[4], p[5]) for p in call_log_params] == [
+        (1000, worker_now, "success"),
+        (2000, worker_now, "error"),
+    ]
+
+
+def test_snapshot_runner_ingest_failure_rolls_back_to_savepoint() -> None:
+    """적재 실패 페이지는 SAVEPOINT까지만 롤백되고 snapshot은 commit되어야 함."""
+    provider = _StubProvider({
+        start: _ok_page([{"rowNum": str(start)}]) for start in (0, 1000)
+    })
+    conn = FakeConn()
+
+    def mock_ingest_rows_page(*, mysql_conn, snapshot_id, collected_at, page_start, page_end, rows):
+        if page_start == 1000:
+            raise RuntimeError("Raw 데이터 적재 실패")
+        return {"attempted_rows": 1, "inserted_rows": 1, "skipped_duplicates": 0}
+
+    with patch("ingestion.runner.snapshot_runner.ingest_rows_page") as mock_ingest:
+        mock_ingest.side_effect = mock_ingest_rows_page
+
+        result = run_snapshot_once(
+            snapshot_id="20260104_120000",
+            call_ranges=[(0, 999), (1000, 1999)],
+            provider=provider,
+            mysql_conn=conn,
+            clock=_clock,
+        )
+
+    assert result["status"] == "partial"
+    executed_sql = _savepoint_sql(conn._cursor)
+    assert "ROLLBACK TO SAVEPOINT page_1000" in executed_sql
+    assert conn.commits == 1
+    assert conn.rollbacks == 0
+    # 호출 자체는 성공했으므로 Call Log는 success
+    call_log_params = _call_log_rows(conn._cursor)
+    assert [p[5] for p in call_log_params] == ["success", "success"]
+
+
+def test_snapshot_runner_commit_failure_marks_pages_error() -> None:
+    """snapshot commit 실패 시 전체 rollback 후 모든 페이지가 error여야 함."""
+    provider = _StubProvider({
+        start: _ok_page([{"rowNum": str(start)}]) for start in (0, 1000)
+    })
+    conn = _CommitOrderConn(commit_error=Exception("Lost connection"))
+
+    with patch("ingestion.runner.snapshot_runner.ingest_rows_page") as mock_ingest:
+        mock_ingest.return_value = {"attempted_rows": 1, "inserted_rows": 1, "skipped_duplicates": 0}
+
+        result = run_snapshot_once(
+            snapshot_id="20260104_120000",
+            call_ranges=[(0, 999), (1000, 1999)],
+            provider=provider,
+            mysql_conn=conn,
+            clock=_clock,
+        )
+
+    assert result["status"] == "error"
+    assert result["inserted_total"] == 0
+    assert conn.rollbacks == 1
+    # 데이터는 rollback되어도 실제 API 호출 기록은 rollback 이후 단독으로 남아야 함
+    assert [p[5] for p in _call_log_rows(conn._cursor)] == ["success", "success"]
+    call_log_index = next(
+        i for i, (sql, _) in enumerate(conn._cursor.executed) if "subway_api_call_log" in sql
+    )
+    assert call_log_index >= conn.rollback_at
+
+
+def test_snapshot_runner_call_log_written_after_commit() -> None:
+    """Call Log는 snapshot 트랜잭션 안이 아니라 commit 이후에 기록되어야 함."""
+    provider = _StubProvider({
+        start: _ok_page() for start in (0, 1000)
+    })
+    conn = _CommitOrderConn()
+
+    with patch("ingestion.runner.snapshot_runner.ingest_rows_page") as mock_ingest:
+        mock_ingest.return_value = {"attempted_rows": 0, "inserted_rows": 0, "skipped_duplicates": 0}
+
+        run_snapshot_once(
+            snapshot_id="20260104_120000",
+            call_ranges=[(0, 999), (1000, 1999)],
+            provider=provider,
+            mysql_conn=conn,
+            clock=_clock,
+        )
+
+    assert conn.commits == 1
+    # commit 시점까지 실행된 SQL에는 Call Log가 없고, 마지막 SQL이 Call Log INSERT
+    assert not any("subway_api_call_log" in sql for sql, _ in conn._cursor.executed[: conn.commit_at])
+    assert "subway_api_call_log" in conn._cursor.executed[-1][0]
+    assert "SAVEPOINT call_log" not in _savepoint_sql(conn._cursor)
+
+
+def test_snapshot_runner_savepoint_rollback_failure_rolls_back_snapshot() -> None:
+    """ROLLBACK TO SAVEPOINT가 실패하면 전체 rollback 후 남은 페이지를 적재하지 않아야 함."""
+    provider = _StubProvider({
+        start: _ok_page() for start in (0, 1000, 2000)
+    })
+    conn = FakeConn(_SavepointRollbackFailCursor())
+
+    def mock_ingest_rows_page(*, mysql_conn, snapshot_id, collected_at, page_start, page_end, rows):
+        if page_start == 1000:
+            raise RuntimeError("Raw 데이터 적재 실패")
+        return {"attempted_rows": 0, "inserted_rows": 0, "skipped_duplicates": 0}
+
+    with patch("ingestion.runner.snapshot_runner.ingest_rows_page") as mock_ingest:
+        mock_ingest.side_effect = mock_ingest_rows_page
+
+        result = run_snapshot_once(
+            snapshot_id="20260104_120000",
+            call_ranges=[(0, 999), (1000, 1999), (2000, 2999)],
+            provider=provider,
+            mysql_conn=conn,
+            clock=_clock,
+        )
+
+    assert result["status"] == "error"
+    assert all(p["status"] == "error" for p in result["pages"])
+    assert "SAVEPOINT 롤백 실패" in result["pages"][0]["error"]
+    # 전체 rollback 이후의 페이지는 autocommit으로 단독 반영되지 않도록 적재하지 않음
+    assert [c.kwargs["page_start"] for c in mock_ingest.call_args_list] == [0, 1000]
+    assert conn.rollbacks == 1
+    assert conn.commits == 0
+    # 호출 자체는 모두 성공했으므로 Call Log는 success로 기록
+    assert [p[5] for p in _call_log_rows(conn._cursor)] == ["success", "success", "success"]
+
+
+def test_snapshot_runner_call_log_flushed_once_when_all_pages_fail() -> None:
+    """모든 페이지 호출이 실패해도 Call Log는 INSERT 1회로 모두 기록되어야 함."""
+    provider = _StubProvider({
+        start: Exception("Network error") for start in (1000, 2000, 3000)
+    })
+    conn = FakeConn()
+
+    result = run_snapshot_once(
+        snapshot_id="20260104_120000",
+        call_ranges=[(1000, 1999), (2000, 2999), (3000, 3999)],
+        provider=provider,
+        mysql_conn=conn,
+        clock=_clock,
+    )
+
+    assert result["status"] == "error"
+    call_log_params = _call_log_rows(conn._cursor)
+    assert [(p[2], p[5]) for p in call_log_params] == [
+        (1000, "error"),
+        (2000, "error"),
+        (3000, "error"),
+    ]
+    assert conn.commits == 1
+
+
+def test_snapshot_runner_dynamic_page_count() -> None:
+    """call_ranges=None이면 page 1 totalCount로 3회/4회 호출을 결정해야 함."""
+    for total_count, expected_ranges in [
+        (3500, [(1000, 1999), (2000, 2999), (3000, 3999)]),
+        (2500, [(1000, 1999), (2000, 2999)]),
+        (None, [(1000, 1999), (2000, 2999)]),
+    ]:
+        provider = _StubProvider({
+            start: _ok_page(total_count=total_count) for start in (0, 1000, 2000, 3000)
+        })
+
+        with patch("ingestion.runner.snapshot_runner.ingest_rows_page") as mock_ingest:
+            mock_ingest.return_value = {"attempted_rows": 0, "inserted_rows": 0, "skipped_duplicates": 0}
+
+            result = run_snapshot_once(
+                snapshot_id="20260104_120000",
+                call_ranges=None,
+                provider=provider,
+                mysql_conn=FakeConn(),
+                clock=_clock,
+            )
+
+        assert result["ranges"] == expected_ranges
+        assert result["decided_page_count"] == len(expected_ranges) + 1
+        assert [(p["start"], p["end"]) for p in result["pages"]] == [(0, 999)] + expected_ranges
+
+
+def test_snapshot_runner_summary_log_skipped_when_info_disabled() -> None:
+    """INFO 로그가 비활성이면 요약 로그 JSON 직렬화를 수행하지 않아야 함."""
+    provider = _StubProvider({1000: _ok_page()})
+
+    with patch("ingestion.runner.snapshot_runner.ingest_rows_page") as mock_ingest, \
+            patch("ingestion.runner.snapshot_runner.logger") as mock_logger, \
+            patch("ingestion.runner.snapshot_runner.json.dumps") as mock_dumps:
+        mock_ingest.return_value = {"attempted_rows": 0, "inserted_rows": 0, "skipped_duplicates": 0}
+        mock_logger.isEnabledFor.return_value = False
+
+        run_snapshot_once(
+            snapshot_id="20260104_120000",
+            call_ranges=[(1000, 1999)],
+            provider=provider,
+            mysql_conn=FakeConn(),
+            clock=_clock,
+        )
+
+    mock_logger.info.assert_not_called()
+    mock_dumps.assert_not_called()
+
+
+def test_snapshot_runner_fetch_failure_skips_rollback() -> None:
+    """API 호출 단계 실패는 DB에 쓴 것이 없으므로 rollback 왕복이 없어야 함."""
+    provider = _StubProvider({
+        0: RuntimeError("HTTP 요청 실패"),
+        1000: _ok_page(),
+        2000: _ok_page(),
+    })
+    conn = FakeConn()
+
+    with patch("ingestion.runner.snapshot_runner.ingest_rows_page") as mock_ingest:
+        mock_ingest.return_value = {"attempted_rows": 0, "inserted_rows": 0, "skipped_duplicates": 0}
+
+        result = run_snapshot_once(
+            snapshot_id="20260104_120000",
+            call_ranges=None,
+            provider=provider,
+            mysql_conn=conn,
+            clock=_clock,
+        )
+
+    assert result["status"] == "partial"
+    assert result["decided_page_count"] == 3  # page 1 실패 시 fallback
+    assert conn.rollbacks == 0
+    executed_sql = _savepoint_sql(conn._cursor)
+    assert not any(sql.startswith("ROLLBACK") for sql in executed_sql)
+    assert "SAVEPOINT page_0" not in executed_sql
+
+
+def test_snapshot_runner_one_raw_insert_per_page() -> None:
+    """실제 ingest_rows_page 경로에서 페이지당 raw INSERT가 1회로 묶이는지 검증."""
+    provider = _StubProvider({
+        start: _ok_page([{"rowNum": str(start + i)} for i in range(50)])
+        for start in (0, 1000, 2000)
+    })
+    conn = FakeConn(FakeCursor(rowcount=50))
+
+    result = run_snapshot_once(
+        snapshot_id="20260104_120000",
+        call_ranges=[(0, 999), (1000, 1999), (2000, 2999)],
+        provider=provider,
+        mysql_conn=conn,
+        clock=_clock,
+    )
+
+    raw_inserts = [sql for sql, _ in conn._cursor.executed if "subway_arrival_raw" in sql]
+    assert len(raw_inserts) == 3  # 150 rows → 페이지당 multi-row INSERT 1회
+    assert result["attempted_total"] == 150
+    assert result["inserted_total"] == 150